@@ -0,0 +1,24 @@
+"""helpers shared by benchmarks"""
+
+# stdlib
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT = os.path.join(ROOT, "bench_output.txt")
+
+# let benchmarks import the app as 'src'
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def record(res: dict) -> None:
+    """print result 'res' and append it as a JSON line to 'OUTPUT'"""
+    res = {"time": time.time(), "python": platform.python_version(), **res}
+    line = json.dumps(res)
+    print(line)
+    with open(OUTPUT, "a") as f:
+        f.write(line + "\n")
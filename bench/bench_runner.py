@@ -0,0 +1,77 @@
+"""benchmark of grading throughput, live through 'QuizRunner' and in bulk through 'BatchGrader'
+
+usage: python bench/bench_runner.py [submission count]
+"""
+
+# stdlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+# here
+from _util import ROOT, record
+
+# here
+from src.engine.batch import BatchGrader
+from src.engine.quiz import load
+from src.engine.runner import QuizRunner
+
+_N = 1_000_000
+_QUIZ = os.path.join(ROOT, "quizes", "commons.yml")
+
+
+def _submissions(quiz, n: int, named: bool) -> list[str]:
+    """return 'n' submission lines, half right answers, named by section and key if 'named'"""
+    rng = random.Random(0)
+    qs = [(s, q) for s, v in quiz.sec.items() for q in v]
+    out = []
+    for _ in range(n):
+        s, q = rng.choice(qs)
+        a = rng.choice(q.ans) if q.ans and rng.random() < 0.5 else "wrong"
+        out.append(
+            json.dumps({"section": s, "key": q.key, "answer": a}) if named else a
+        )
+    return out
+
+
+def bench_batch(quiz, n: int) -> None:
+    """time grading and tabulating 'n' recorded answers in bulk"""
+    rows = [json.loads(ln) for ln in _submissions(quiz, n, True)]
+    sec = [r["section"] for r in rows]
+    key = [str(r["key"]) for r in rows]
+    ans = [r["answer"] for r in rows]
+    for typos in (0, 1):
+        g = BatchGrader(quiz, typos)
+        t = time.perf_counter()
+        g.accuracy(*g.grade(sec, key, ans))
+        t = time.perf_counter() - t
+        record({"bench": "batch", "rows": n, "typos": typos, "per_s": n / t})
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else _N
+    quiz = load(_QUIZ)
+    for named in (False, True):
+        for typos in (0, 1):
+            lines = _submissions(quiz, n, named)
+            run = QuizRunner(quiz, typos=typos, seed=0)
+            t = time.perf_counter()
+            run.run(lines, io.StringIO())
+            t = time.perf_counter() - t
+            record(
+                {
+                    "bench": "runner",
+                    "submissions": n,
+                    "named": named,
+                    "typos": typos,
+                    "per_s": n / t,
+                }
+            )
+    bench_batch(quiz, n)
+
+
+if __name__ == "__main__":
+    main()
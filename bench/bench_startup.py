@@ -0,0 +1,43 @@
+"""benchmark of cold start, checked against a time budget"""
+
+# stdlib
+import json
+import statistics
+import subprocess
+import sys
+
+# here
+from _util import ROOT, record
+
+_BUDGET = 1.0  # seconds from start to home screen painted
+_RUNS = 5
+
+
+def _profile() -> dict:
+    """return startup profile of a fresh interpreter"""
+    r = subprocess.run(
+        [sys.executable, "main.py", "--profile-startup", "--headless", "--json"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(r.stderr.strip().splitlines()[-1])
+
+
+def main() -> int:
+    runs = [_profile() for _ in range(_RUNS)]
+    res = {
+        "bench": "startup",
+        "runs": _RUNS,
+        "import_s": statistics.median(r["import_total"] for r in runs),
+        "ready_s": statistics.median(r["ready"] for r in runs),
+        "budget_s": _BUDGET,
+    }
+    res["ok"] = res["ready_s"] <= _BUDGET
+    record(res)
+    return 0 if res["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
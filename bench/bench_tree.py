@@ -0,0 +1,186 @@
+"""benchmarks of 'NodeTree' and the window stack, run headless through the textual pilot
+
+usage: python bench/bench_tree.py [node count ...]
+"""
+
+# stdlib
+import asyncio
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# here
+from _util import record
+
+# textual
+from textual.app import App, ComposeResult
+
+# here
+from src.app import QuizTUI
+from src.node_tree import Node, NodeTree, _NodeSliverStack, _NodeSliverTree
+from src.windows.file_window import FileWindow
+
+_SIZES = [1_000, 10_000, 100_000]
+_SCREEN = (100, 40)
+_KEYS = 50  # key presses to time per key
+
+
+def _nodes(n: int) -> list[Node]:
+    """return a root with about 'n' nodes, as square directories of leaves"""
+    w = max(1, round(math.sqrt(n)))
+    return [
+        Node(
+            "root",
+            [
+                Node(f"dir{i}", [Node(f"leaf{i}_{j}.yml") for j in range(w)])
+                for i in range(w)
+            ],
+        )
+    ]
+
+
+def _library(path: str, n: int) -> None:
+    """write a quiz library of about 'n' empty files below 'path'"""
+    w = max(1, round(math.sqrt(n)))
+    for i in range(w):
+        d = os.path.join(path, "quizes_test", f"dir{i}")
+        os.makedirs(d)
+        for j in range(w):
+            open(os.path.join(d, f"quiz{j}.yml"), "w").close()
+
+
+def _ms(ts: list[float]) -> dict:
+    """return median and worst of times 'ts', in milliseconds"""
+    return {"median_ms": statistics.median(ts) * 1000, "max_ms": max(ts) * 1000}
+
+
+class _TreeApp(App):
+    def __init__(self, nodes: list[Node]) -> None:
+        super().__init__()
+        self._roots = nodes
+
+    def compose(self) -> ComposeResult:
+        yield NodeTree(self._roots, "multi")
+
+
+async def _press(pilot, key: str, times: int) -> list[float]:
+    """return latency of each of 'times' presses of 'key', until the app settled"""
+    ts = []
+    for _ in range(times):
+        t = time.perf_counter()
+        await pilot.press(key)
+        await pilot.pause()
+        ts.append(time.perf_counter() - t)
+    return ts
+
+
+def bench_build(n: int) -> None:
+    """time building the sliver tree, top level then in whole"""
+    nodes = _nodes(n)
+    t = time.perf_counter()
+    nt = _NodeSliverTree(nodes)
+    t1 = time.perf_counter()
+    nt.load_all(0)
+    t2 = time.perf_counter()
+    record(
+        {
+            "bench": "tree_build",
+            "nodes": len(nt.nod),
+            "build_ms": (t1 - t) * 1000,
+            "load_all_ms": (t2 - t1) * 1000,
+        }
+    )
+
+
+async def bench_tree(n: int) -> None:
+    """time rendering, pointer keys and multi-select on a mounted 'NodeTree'"""
+    nodes = _nodes(n)
+    app = _TreeApp(nodes)
+    async with app.run_test(size=_SCREEN) as pilot:
+        await pilot.pause()
+        tree = app.query_one(NodeTree)
+        tree.focus()
+        nss = app.query_one(_NodeSliverStack)
+        # expand every directory, so there are 'n' rows to move over
+        t = time.perf_counter()
+        await pilot.press("right")
+        await pilot.pause()
+        nt = nss.nt
+        for r in range(len(nt) - 1, 0, -1):
+            nt.expand(r)
+        nss.resize()
+        await pilot.pause()
+        expand = time.perf_counter() - t
+        # 'render_line', cold then cached
+        h = nss.size.height
+        res = {
+            "bench": "tree",
+            "nodes": len(nt.nod),
+            "rows": len(nt),
+            "expand_ms": expand * 1000,
+        }
+        for k in ("cold", "warm"):
+            t = time.perf_counter()
+            for _ in range(20):
+                if k == "cold":
+                    nss.notify_style_update()
+                for y in range(h):
+                    nss.render_line(y)
+            res[f"render_{k}_rows_per_s"] = 20 * h / (time.perf_counter() - t)
+        # pointer moves alone, without the frame after
+        t = time.perf_counter()
+        for _ in range(_KEYS):
+            tree._action_next()
+        res["action_down_us"] = (time.perf_counter() - t) / _KEYS * 1e6
+        await _press(pilot, "home", 1)
+        # key repeat and scroll, until the frame settled
+        res["key_down"] = _ms(await _press(pilot, "down", _KEYS))
+        res["key_up"] = _ms(await _press(pilot, "up", _KEYS))
+        res["key_end"] = _ms(await _press(pilot, "end", 5))
+        res["key_home"] = _ms(await _press(pilot, "home", 5))
+        # multi-select of everything, then none
+        res["select_all"] = _ms(await _press(pilot, "space", 1))
+        res["select_none"] = _ms(await _press(pilot, "space", 1))
+        # type-ahead to the last leaf
+        t = time.perf_counter()
+        await pilot.press(*f"leaf{math.isqrt(n)}")
+        await pilot.pause()
+        res["search_ms"] = (time.perf_counter() - t) * 1000
+        record(res)
+
+
+async def bench_windows(n: int) -> None:
+    """time scanning a quiz library of 'n' files and switching notches, in 'QuizTUI'"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as d:
+        _library(d, n)
+        os.chdir(d)
+        try:
+            app = QuizTUI()
+            t = time.perf_counter()
+            async with app.run_test(size=_SCREEN) as pilot:
+                fw = app.screen.query_one(FileWindow)
+                while str(fw._msg.renderable) != FileWindow._MSG:
+                    await pilot.pause(0.01)
+                scan = time.perf_counter() - t
+                ts = await _press(pilot, "tab", 9)
+            record(
+                {"bench": "windows", "files": n, "scan_ms": scan * 1000, "switch": _ms(ts)}
+            )
+        finally:
+            os.chdir(cwd)
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or _SIZES
+    for n in sizes:
+        bench_build(n)
+        asyncio.run(bench_tree(n))
+        asyncio.run(bench_windows(n))
+
+
+if __name__ == "__main__":
+    main()
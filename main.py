@@ -1,7 +1,130 @@
 """main module"""
 
-# here
-from src.app import QuizTUI
+# stdlib
+import argparse
+import json
+import sys
 
-# run app
-QuizTUI().run()
+
+def _args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="play quizes in the terminal")
+    p.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="time imports, widget construction and first paint, then exit",
+    )
+    p.add_argument("--headless", action="store_true", help="run without a terminal")
+    p.add_argument(
+        "--json", action="store_true", dest="profile_json", help="print profile as JSON"
+    )
+    sub = p.add_subparsers(dest="cmd")
+    c = sub.add_parser(
+        "compile", help="validate quiz files below a directory and compile them to the cache"
+    )
+    c.add_argument("dir", help="quiz library directory")
+    c.add_argument("-j", "--jobs", type=int, help="worker processes, default all cores")
+    c.add_argument("--cache-dir", help="cache directory, default the user cache")
+    r = sub.add_parser(
+        "run", help="grade answers to a quiz without a terminal, results as JSON lines"
+    )
+    r.add_argument("quiz", help="quiz file")
+    r.add_argument("-a", "--answers", help="answers file, default stdin")
+    r.add_argument("-s", "--section", action="append", help="section to ask, repeatable")
+    r.add_argument("--typos", type=int, default=0, help="most typos allowed per answer")
+    r.add_argument("--seed", type=int, help="seed for drawing questions")
+    r.add_argument("--ask", action="store_true", help="write each question before its answer")
+    r.add_argument("--cache-dir", help="cache directory, default the user cache")
+    g = sub.add_parser("grade", help="grade recorded answer logs, print accuracy tables")
+    g.add_argument("quiz", help="quiz file")
+    g.add_argument("log", nargs="+", help="answer log, JSON lines or tab separated")
+    g.add_argument("--typos", type=int, default=0, help="most typos allowed per answer")
+    g.add_argument("--json", action="store_true", help="print tables as JSON")
+    g.add_argument("--cache-dir", help="cache directory, default the user cache")
+    return p.parse_args()
+
+
+def _compile(args: argparse.Namespace) -> int:
+    # here
+    from src.engine.compiler import compile_library, quiz_files
+
+    paths = quiz_files(args.dir)
+    bad = 0
+    for path, err in compile_library(paths, args.cache_dir, args.jobs):
+        if err:
+            bad += 1
+        for line, msg in err:
+            print(f"{path}:{line}: {msg}")
+    print(f"{len(paths)} files, {bad} with errors", file=sys.stderr)
+    return 1 if bad else 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    # here
+    from src.engine.cache import QuizCache
+    from src.engine.runner import QuizRunner
+
+    q = QuizCache(args.cache_dir).load(args.quiz)
+    run = QuizRunner(q, args.section, args.typos, args.seed)
+    f = open(args.answers, encoding="utf-8") if args.answers else sys.stdin
+    with f:
+        n, c = run.run(f, sys.stdout, args.ask)
+    print(f"{n} graded, {c} correct", file=sys.stderr)
+    return 0
+
+
+def _grade(args: argparse.Namespace) -> int:
+    # here
+    from src.engine.batch import BatchGrader, load_log
+    from src.engine.cache import QuizCache
+
+    g = BatchGrader(QuizCache(args.cache_dir).load(args.quiz), args.typos)
+    sec, key, ans = [], [], []
+    for path in args.log:
+        s, k, a, bad = load_log(path)
+        for line, msg in bad:
+            print(f"{path}:{line}: {msg}", file=sys.stderr)
+        sec += s
+        key += k
+        ans += a
+    acc = g.accuracy(*g.grade(sec, key, ans))
+    if args.json:
+        print(json.dumps(acc))
+        return 0
+    pct = lambda r: f"{r['accuracy'] * 100:6.1f}%" if r["answered"] else "      -"
+    print(f"{'section':<24}{'key':<10}{'answered':>10}{'correct':>10}{'accuracy':>9}")
+    for r in acc["questions"]:
+        t = f"{r['section'][:23]:<24}{str(r['key'])[:9]:<10}"
+        print(f"{t}{r['answered']:>10}{r['correct']:>10}  {pct(r)}")
+    print()
+    print(f"{'section':<34}{'answered':>10}{'correct':>10}{'accuracy':>9}")
+    for s, r in acc["sections"].items():
+        print(f"{s[:33]:<34}{r['answered']:>10}{r['correct']:>10}  {pct(r)}")
+    if acc["unknown"]:
+        print(f"{acc['unknown']} answers to no such question", file=sys.stderr)
+    return 0
+
+
+args = _args()
+if args.cmd == "compile":
+    sys.exit(_compile(args))
+elif args.cmd == "run":
+    sys.exit(_run(args))
+elif args.cmd == "grade":
+    sys.exit(_grade(args))
+elif args.profile_startup:
+    # here
+    from src.profiler import StartupProfiler
+
+    prof = StartupProfiler()
+    prof.run(headless=args.headless)
+    print(json.dumps(prof.report()) if args.profile_json else prof.format(), file=sys.stderr)
+else:
+    # here
+    from src.app import QuizTUI
+
+    # run app
+    app = QuizTUI()
+    app.run(headless=args.headless)
+    if app.prg_err is not None:
+        print(f"progress not saved: {app.prg_err}", file=sys.stderr)
+        sys.exit(1)
@@ -1,4 +1,8 @@
 """top level module for app"""
+# stdlib
+import os
+import sqlite3
+
 # rich
 from rich.segment import Segment
 
@@ -12,8 +16,11 @@ from textual.widget import Widget
 from textual.widgets import Footer, Label
 
 # here
+from .engine.progress import ProgressStore
+from .instrument import Instrument, InstrumentCommands, InstrumentOverlay, dump
+from .node_tree import _InfoBar, _NodeSliverStack
 from .other import install_mark_border
-from .notched_widgets import Notch, NotchedWidgets
+from .notched_widgets import Notch, NotchedWidgets, _NotchSliver
 from .windows.file_window import FileWindow, TITLE as FILE_TITLE
 from .windows.game_window import GameWindow, TITLE as GAME_TITLE
 from .windows.quiz_window import QuizWindow, TITLE as QUIZ_TITLE
@@ -70,21 +77,35 @@ class Home(Screen):
         Binding("tab", "switch_widget", priority=True),
     ]
 
-    _NCH = [Notch(FILE_TITLE), Notch(QUIZ_TITLE), Notch(GAME_TITLE)]
-    _WID = [FileWindow("quizes_test"), QuizWindow(), GameWindow()]
-    _NW = NotchedWidgets(_NCH, _WID)
+    __slots__ = [
+        "_nw",  # 'NotchedWidgets' ref.
+        "_wid",  # windows
+    ]
+
+    def __init__(self, progress: ProgressStore | None = None) -> None:
+        super().__init__()
+        # built with the screen, not at import, so importing scans nothing
+        self._wid = [FileWindow("quizes_test"), QuizWindow(), GameWindow(progress)]
+        self._nw = NotchedWidgets(
+            [Notch(FILE_TITLE), Notch(QUIZ_TITLE), Notch(GAME_TITLE)], self._wid
+        )
 
-    @staticmethod
-    def action_switch_widget() -> None:
+    def action_switch_widget(self) -> None:
         """switch to next notch + window"""
-        Home._NW.switch_to_next()
+        self._nw.switch_to_next()
+        # play what is selected, does nothing if already playing it
+        self._wid[2].start(*self._wid[1].get_selected())
+
+    def on_file_window_picked(self, event: FileWindow.Picked) -> None:
+        """on quiz file picked in 'FileWindow'"""
+        self._wid[1].show(event.path)
 
     def compose(self) -> ComposeResult:
         with Container() as c:
             c.styles.align_horizontal = "center"
             c.styles.height = "auto"
             yield Banner(_TITLE)
-        yield self._NW
+        yield self._nw
         yield Footer()
 
 
@@ -117,18 +138,73 @@ class QuizTUI(App):
         Binding("ctrl+c", "quit", "Quit"),
         Binding("ctrl+t", "toggle_mode", "Toggle"),
         Binding("?", "push_screen('info')", "Info"),
+        Binding("f2", "toggle_instrument", "Instrument", show=False),
     ]
 
+    COMMANDS = App.COMMANDS | {InstrumentCommands}
+
     CSS_PATH = "styling/styling.tcss"
 
-    SCREENS = {"info": Info()}
+    SCREENS = {"info": Info}  # built on first push
+
+    _INSTRUMENT_DUMP = "instrument.json"
+
+    __slots__ = [
+        "_ins",  # 'Instrument', 'None' until first toggled
+        "_ovl",  # 'InstrumentOverlay' ref. while shown
+        "prg",  # 'ProgressStore', open while mounted
+        "prg_err",  # 'sqlite3.Error' saving progress, 'None' if saved
+    ]
 
     install_mark_border()
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._ins = None
+        self._ovl = None
+        self.prg = None
+        self.prg_err = None
+
     def _action_toggle_mode(self) -> None:
         self.dark = not self.dark
 
+    def action_toggle_instrument(self) -> None:
+        """start recording render costs and show them, or stop"""
+        if self._ins is None:
+            self._ins = Instrument([_NodeSliverStack, _InfoBar, Banner, _NotchSliver])
+        if self._ovl is None:
+            self._ins.start()
+            self._ovl = InstrumentOverlay(self._ins)
+            self.screen.mount(self._ovl)
+        else:
+            self._ins.stop()
+            self._ovl.remove()
+            self._ovl = None
+
+    def dump_instrument(self) -> None:
+        """write recorded render costs as JSON"""
+        if self._ins is None:
+            self.notify("Nothing recorded, toggle the instrument first", severity="warning")
+            return
+        dump(self._ins, self._INSTRUMENT_DUMP)
+        self.notify(f"Wrote {os.path.abspath(self._INSTRUMENT_DUMP)}")
+
+    def reset_instrument(self) -> None:
+        """clear recorded render costs"""
+        if self._ins is not None:
+            self._ins.reset()
+
     def on_mount(self) -> None:
         """on app mount event"""
-        self.install_screen(Home(), name="home")
+        self.prg = ProgressStore()
+        self.install_screen(Home(self.prg), name="home")
         self.push_screen("home")
+
+    def on_unmount(self) -> None:
+        """on app unmount event, after its screens are gone"""
+        if self.prg is not None:
+            try:
+                self.prg.close()  # writes answers still queued
+            except sqlite3.Error as e:
+                self.prg_err = e  # told once the terminal is restored, after 'run'
+            self.prg = None
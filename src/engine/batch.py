@@ -0,0 +1,184 @@
+"""description for 'BatchGrader'"""
+
+# stdlib
+from __future__ import annotations
+from collections.abc import Iterable
+import itertools
+import json
+
+# numpy
+import numpy as np
+
+# here
+from .matcher import Matcher, normalize
+from .quiz import Quiz
+
+
+def _factorize(values: Iterable, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """return (index of first occurrence per distinct value, distinct value per item), of 'n' 'values'"""
+    d = {}
+    # each item -> index where its value first came, done by 'dict' in C
+    f = np.fromiter(map(d.setdefault, values, itertools.count()), np.int64, n)
+    u = np.flatnonzero(f == np.arange(n))
+    lut = np.empty(n, dtype=np.int64)
+    lut[u] = np.arange(len(u))
+    return (u, lut[f])
+
+
+def load_log(path: str) -> tuple[list[str], list[str], list[str], list[tuple[int, str]]]:
+    """return (sections, keys, answers, (line, message) of bad lines) of answer log 'path'
+
+    a log holds one answer per line, as a JSON object of 'section', 'key'
+    and 'answer' (the named submissions of 'QuizRunner'), or as the three
+    separated by tabs; bad lines are left out
+    """
+    sec, key, ans, bad = [], [], [], []
+    with open(path, encoding="utf-8") as f:
+        for n, ln in enumerate(f, 1):
+            if ln.startswith("{"):
+                try:
+                    d = json.loads(ln)
+                    r = (str(d["section"]), str(d["key"]), str(d["answer"]))
+                except ValueError as e:
+                    bad.append((n, f"bad JSON: {e}"))
+                    continue
+                except (KeyError, TypeError) as e:
+                    bad.append((n, f"bad answer, no field {e}"))
+                    continue
+            elif ln.strip():
+                r = ln.rstrip("\n").split("\t", 2)
+                if len(r) != 3:
+                    bad.append((n, f"expected 3 tab separated fields, got {len(r)}"))
+                    continue
+            else:
+                continue
+            sec.append(r[0])
+            key.append(r[1])
+            ans.append(r[2])
+    return (sec, key, ans, bad)
+
+
+class BatchGrader:
+    """grader of recorded answers in bulk, over NumPy arrays
+
+    each distinct answer gets normalized once, in both case modes, then
+    rows are matched by looking up (normalized answer, question) keys in
+    the sorted keys of accepted answers; near misses, if 'typos' allows
+    any, are checked once per distinct (question, answer) with a 'Matcher'
+    """
+
+    __slots__ = [
+        "_acc",  # accepted keys, sorted, normalized id * questions + question
+        "_cas",  # question -> case-sensitive
+        "_ids",  # (section, key as text) -> question
+        "_mat",  # question -> 'Matcher', built on first use
+        "_nrm",  # normalized text -> id
+        "_sid",  # question -> section index
+        "_txt",  # normalized id -> text
+        "_typ",  # most typos allowed
+        "que",  # (section, 'Question') of questions
+        "sec",  # section names
+    ]
+
+    def __init__(self, quiz: Quiz, typos=0) -> None:
+        self.que = [(s, q) for s, qs in quiz.sec.items() for q in qs]
+        self.sec = list(quiz.sec)
+        si = {s: i for i, s in enumerate(self.sec)}
+        self._ids = {(s, str(q.key)): i for i, (s, q) in enumerate(self.que)}
+        self._cas = np.array([q.cas for _, q in self.que], dtype=bool)
+        self._sid = np.array([si[s] for s, _ in self.que], dtype=np.int64)
+        self._mat = [None] * len(self.que)
+        self._nrm = {}
+        self._txt = []
+        self._typ = typos
+        acc = [
+            self._norm_id(normalize(a, q.cas)) * len(self.que) + i
+            for i, (_, q) in enumerate(self.que)
+            for a in q.ans
+        ]
+        self._acc = np.unique(np.array(acc, dtype=np.int64))
+
+    def _norm_id(self, n: str) -> int:
+        """return id of normalized text 'n'"""
+        i = self._nrm.get(n)
+        if i is None:
+            i = self._nrm[n] = len(self._txt)
+            self._txt.append(n)
+        return i
+
+    def _near(self, keys: np.ndarray) -> np.ndarray:
+        """return whether missed 'keys' count as answered within typos"""
+        uk, inv = np.unique(keys, return_inverse=True)
+        nq = len(self.que)
+        ok = np.zeros(len(uk), dtype=bool)
+        for j, k in enumerate(uk.tolist()):
+            i = k % nq
+            m = self._mat[i]
+            if m is None:
+                m = self._mat[i] = Matcher.of(self.que[i][1], self._typ)
+            ok[j] = m.match(self._txt[k // nq]) is not None
+        return ok[inv]
+
+    def accuracy(self, qid: np.ndarray, ok: np.ndarray) -> dict:
+        """return answered, correct and accuracy per question and per section, as a plain dict
+
+        from 'grade' output
+        """
+        v = qid >= 0
+        q, c = qid[v], ok[v]
+        nq = len(self.que)
+        qa = np.bincount(q, minlength=nq)
+        qc = np.bincount(q, weights=c, minlength=nq).astype(np.int64)
+        sa = np.bincount(self._sid[q], minlength=len(self.sec))
+        sc = np.bincount(self._sid[q], weights=c, minlength=len(self.sec)).astype(np.int64)
+
+        def row(a: int, c: int) -> dict:
+            return {"answered": a, "correct": c, "accuracy": c / a if a else None}
+
+        return {
+            "questions": [
+                {"section": s, "key": q.key, **row(a, c)}
+                for (s, q), a, c in zip(self.que, qa.tolist(), qc.tolist())
+            ],
+            "sections": {s: row(a, c) for s, a, c in zip(self.sec, sa.tolist(), sc.tolist())},
+            "unknown": int(len(qid) - v.sum()),
+        }
+
+    def grade(
+        self, sections: list[str], keys: list[str], answers: list[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """grade rows of answers to questions named by section and key
+
+        return (question per row, -1 if no such question; whether correct per row)
+        """
+        n = len(answers)
+        if not n:
+            return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool))
+        # distinct sections and keys -> question per distinct pair
+        su, sc = _factorize(sections, n)
+        ku, kc = _factorize(keys, n)
+        pu, pc = np.unique(sc * len(ku) + kc, return_inverse=True)
+        qs = np.array(
+            [
+                self._ids.get((sections[su[i // len(ku)]], keys[ku[i % len(ku)]]), -1)
+                for i in pu.tolist()
+            ],
+            dtype=np.int64,
+        )
+        qid = qs[pc]
+        # distinct answers, normalized once per case mode
+        au, code = _factorize(answers, n)
+        ua = [answers[i] for i in au.tolist()]
+        ncs = np.array([self._norm_id(normalize(a)) for a in ua], dtype=np.int64)
+        nci = np.array([self._norm_id(normalize(a, False)) for a in ua], dtype=np.int64)
+        v = qid >= 0
+        q = np.where(v, qid, 0)
+        k = np.where(self._cas[q], ncs[code], nci[code]) * len(self.que) + q
+        p = np.searchsorted(self._acc, k)
+        p[p == len(self._acc)] = 0
+        ok = (self._acc[p] == k) & v if len(self._acc) else np.zeros(n, dtype=bool)
+        if self._typ > 0:
+            miss = v & ~ok
+            if miss.any():
+                ok[miss] = self._near(k[miss])
+        return (qid, ok)
@@ -0,0 +1,128 @@
+"""description for 'QuizCache'"""
+
+# stdlib
+import hashlib
+import mmap
+import os
+import struct
+
+# msgpack
+import msgpack
+
+# here
+from . import quiz
+from .quiz import Quiz
+
+
+_MAGIC = b"QTC1"
+_HEAD = struct.Struct("<4sI")  # magic, header length
+
+
+def _digest(path: str) -> bytes:
+    """return content hash of file 'path'"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for b in iter(lambda: f.read(1 << 20), b""):
+            h.update(b)
+    return h.digest()
+
+
+def default_dir() -> str:
+    """return the user cache directory for compiled quizes"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "quiz-tui")
+
+
+class QuizCache:
+    """store of quiz files compiled to a binary form, checked against source mtime and hash
+
+    an entry is laid out as: magic, header length, msgpack header of
+    source (mtime, size, hash), then msgpack body of 'Quiz.to_rows'
+    """
+
+    __slots__ = [
+        "_dir",  # cache directory
+    ]
+
+    def __init__(self, directory: str | None = None) -> None:
+        self._dir = directory or default_dir()
+
+    def _read_header(self, mm: mmap.mmap) -> tuple[dict, int] | None:
+        """return (header, body offset) of an entry, 'None' if malformed"""
+        if len(mm) < _HEAD.size:
+            return None
+        magic, n = _HEAD.unpack_from(mm)
+        if magic != _MAGIC or len(mm) < _HEAD.size + n:
+            return None
+        try:
+            h = msgpack.unpackb(mm[_HEAD.size : _HEAD.size + n])
+        except (ValueError, msgpack.UnpackException):
+            return None
+        if not isinstance(h, dict) or not {"mtime", "size", "hash"} <= h.keys():
+            return None
+        return h, _HEAD.size + n
+
+    def _write(self, dst: str, header: dict, body: bytes) -> None:
+        """write an entry atomically"""
+        h = msgpack.packb(header)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        tmp = f"{dst}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEAD.pack(_MAGIC, len(h)))
+            f.write(h)
+            f.write(body)
+        os.replace(tmp, dst)
+
+    def entry(self, src: str) -> str:
+        """return path of the cache entry for quiz file 'src'"""
+        k = hashlib.blake2b(os.path.abspath(src).encode(), digest_size=16)
+        return os.path.join(self._dir, k.hexdigest() + ".qc")
+
+    def compile(self, src: str, q: Quiz | None = None) -> Quiz:
+        """parse quiz file 'src' (unless given as 'q') and store it compiled"""
+        st = os.stat(src)
+        if q is None:
+            q = quiz.load(src)
+        header = {"mtime": st.st_mtime_ns, "size": st.st_size, "hash": _digest(src)}
+        self._write(self.entry(src), header, msgpack.packb(q.to_rows()))
+        return q
+
+    def get(self, src: str, names: list[str] | None = None) -> Quiz | None:
+        """return quiz file 'src' from cache, only sections 'names' if given
+
+        'None' if not cached, stale, unreadable, or missing any of 'names'
+        """
+        st = os.stat(src)
+        dst = self.entry(src)
+        try:
+            with open(dst, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # missing or empty entry
+            return None
+        with mm:
+            r = self._read_header(mm)
+            if r is None:
+                return None
+            h, ofs = r
+            # if touched but same content -> refresh header only
+            if h["mtime"] != st.st_mtime_ns or h["size"] != st.st_size:
+                d = _digest(src)
+                if h["size"] != st.st_size or h["hash"] != d:
+                    return None
+                h = {"mtime": st.st_mtime_ns, "size": st.st_size, "hash": d}
+                self._write(dst, h, mm[ofs:])
+            try:
+                with memoryview(mm) as mv:
+                    q = Quiz.from_rows(msgpack.unpackb(mv[ofs:], strict_map_key=False))
+            except (TypeError, ValueError, msgpack.UnpackException):  # corrupt body
+                return None
+        if names is None:
+            return q
+        if any(n not in q.sec for n in names):
+            return None
+        return Quiz(q.intro, {n: q.sec[n] for n in names})
+
+    def load(self, src: str) -> Quiz:
+        """return quiz file 'src', from cache if fresh else compiled anew"""
+        q = self.get(src)
+        return q if q is not None else self.compile(src)
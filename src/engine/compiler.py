@@ -0,0 +1,155 @@
+"""description for 'compile_library'"""
+
+# stdlib
+from __future__ import annotations
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+# yaml
+import yaml
+
+# here
+from .cache import QuizCache
+from .quiz import _LOADER, Quiz
+
+
+_BOOL = "tag:yaml.org,2002:bool"
+_INT = "tag:yaml.org,2002:int"
+_NULL = "tag:yaml.org,2002:null"
+
+
+def _scalar(n: yaml.Node) -> str | None:
+    """return error of node 'n' as text, 'None' if fine"""
+    if not isinstance(n, yaml.ScalarNode) or n.tag == _NULL:
+        return "is not text"
+    return None
+
+
+def _scalars(n: yaml.Node, empty: bool) -> str | None:
+    """return error of node 'n' as a list of text, 'None' if fine"""
+    if n.tag == _NULL and empty:
+        return None
+    if not isinstance(n, yaml.SequenceNode):
+        return "is not a list"
+    if not n.value and not empty:
+        return "is empty"
+    for m in n.value:
+        if _scalar(m):
+            return f"has a non-text item on line {m.start_mark.line + 1}"
+    return None
+
+
+# question field -> (required, check returning an error, 'None' if fine)
+_FIELDS = {
+    "answers": (True, lambda n: _scalars(n, empty=False)),
+    "case-sensitive": (False, lambda n: None if n.tag == _BOOL else "is not a boolean"),
+    "info": (False, lambda n: _scalars(n, empty=True)),
+    "question": (True, lambda n: _scalar(n)),
+    "weight": (False, lambda n: None if n.tag == _INT else "is not an integer"),
+}
+
+
+def _check(root: yaml.Node | None) -> list[tuple[int, str]]:
+    """return (line, message) of schema errors in quiz document 'root'"""
+    if root is None:
+        return [(1, "file is empty")]
+    if not isinstance(root, yaml.MappingNode):
+        return [(root.start_mark.line + 1, "top level is not a mapping")]
+    err = []
+    for k, v in root.value:
+        ln = v.start_mark.line + 1
+        if k.value == "intro":
+            if _scalar(v):
+                err.append((ln, "'intro' is not text"))
+            continue
+        if not isinstance(v, yaml.MappingNode):
+            err.append((ln, f"section '{k.value}' is not a mapping"))
+            continue
+        for qk, qv in v.value:
+            name = f"'{k.value}.{qk.value}'"
+            if not isinstance(qv, yaml.MappingNode):
+                err.append((qv.start_mark.line + 1, f"question {name} is not a mapping"))
+                continue
+            seen = set()
+            for fk, fv in qv.value:
+                f = fk.value
+                fl = fk.start_mark.line + 1
+                if f not in _FIELDS:
+                    err.append((fl, f"question {name} has unknown field '{f}'"))
+                    continue
+                if f in seen:
+                    err.append((fl, f"question {name} repeats field '{f}'"))
+                seen.add(f)
+                e = _FIELDS[f][1](fv)
+                if e:
+                    err.append((fv.start_mark.line + 1, f"question {name} field '{f}' {e}"))
+            for f, (req, _) in _FIELDS.items():
+                if req and f not in seen:
+                    err.append((qv.start_mark.line + 1, f"question {name} lacks '{f}'"))
+    err.sort(key=lambda e: e[0])
+    return err
+
+
+def validate(path: str) -> tuple[Quiz | None, list[tuple[int, str]]]:
+    """parse and check quiz file 'path' against the quiz schema
+
+    return ('Quiz', no errors) if valid, else ('None', (line, message) of errors),
+    line 0 if not tied to one
+    """
+    try:
+        with open(path, "rb") as f:
+            ld = _LOADER(f)
+            try:
+                root = ld.get_single_node()  # nodes keep their lines
+                err = _check(root)
+                if err:
+                    return (None, err)
+                return (Quiz.from_dict(ld.construct_document(root)), [])
+            finally:
+                ld.dispose()
+    except yaml.MarkedYAMLError as e:
+        m = e.problem_mark or e.context_mark
+        return (None, [(m.line + 1 if m else 0, f"YAML: {e.problem or e.context}")])
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+        return (None, [(0, str(e))])
+
+
+def _compile(job: tuple[str, str | None]) -> tuple[str, list[tuple[int, str]]]:
+    """validate one quiz file, and store it in the cache if valid, in a pool worker"""
+    path, cache_dir = job
+    q, err = validate(path)
+    if q is not None:
+        try:
+            QuizCache(cache_dir).compile(path, q)
+        except OSError as e:
+            err = [(0, f"cache: {e}")]
+    return (path, err)
+
+
+def quiz_files(root: str, ext=".yml") -> list[str]:
+    """return paths of quiz files below 'root', sorted"""
+    out = []
+    for d, dirs, files in os.walk(root):
+        dirs[:] = [n for n in dirs if not n.startswith(".")]
+        out += [os.path.join(d, n) for n in files if n.endswith(ext)]
+    out.sort()
+    return out
+
+
+def compile_library(
+    paths: list[str], cache_dir: str | None = None, jobs: int | None = None
+) -> Iterator[tuple[str, list[tuple[int, str]]]]:
+    """validate quiz files 'paths' over a process pool, compiling the valid into the cache
+
+    yield (path, errors) in order of 'paths', 'jobs' 1 keeps it in process
+    """
+    job = [(p, cache_dir) for p in paths]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(job) < 2:
+        yield from map(_compile, job)
+        return
+    # chunks several per worker, few enough to keep all busy till the end
+    n = max(1, len(job) // (jobs * 8))
+    with ProcessPoolExecutor(jobs) as ex:
+        yield from ex.map(_compile, job, chunksize=n)
@@ -0,0 +1,128 @@
+"""description for 'QuizIndex'"""
+
+# stdlib
+from __future__ import annotations
+from collections.abc import Callable
+
+# yaml
+import yaml
+
+# here
+from .quiz import _LOADER, Question, Quiz, QuizError
+
+
+class _Section:
+    __slots__ = [
+        "beg",  # (line, column) where the section mapping starts
+        "cnt",  # question count
+        "fin",  # (line, column) where the section mapping ends
+    ]
+
+    def __init__(self, beg: tuple[int, int]) -> None:
+        self.beg = beg
+        self.cnt = 0
+        self.fin = beg
+
+
+class QuizIndex:
+    """section names, counts and offsets of a quiz file, read in one pass over its YAML events"""
+
+    __slots__ = [
+        "intro",  # intro text
+        "path",  # quiz file path
+        "sec",  # section name -> '_Section'
+    ]
+
+    def __init__(self, path: str, intro: str, sections: dict[str, _Section]) -> None:
+        self.intro = intro
+        self.path = path
+        self.sec = sections
+
+    def __repr__(self) -> str:
+        return f"QuizIndex({', '.join(f'{k}: {v.cnt}' for k, v in self.sec.items())})"
+
+    @staticmethod
+    def build(path: str, cancelled: Callable[[], bool] | None = None) -> QuizIndex | None:
+        """index quiz file 'path', 'None' if 'cancelled' turns true on the way"""
+        intro = ""
+        sec = {}
+        # stack of open collections, [is mapping, expecting key, key, section]
+        st = []
+        with open(path, "rb") as f:
+            for n, e in enumerate(yaml.parse(f, Loader=_LOADER)):
+                if cancelled and not n & 0xFFF and cancelled():
+                    return None
+                if isinstance(e, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    m = isinstance(e, yaml.MappingStartEvent)
+                    s = None
+                    if len(st) == 1 and m and not st[0][1]:  # if section
+                        s = sec[st[0][2]] = _Section(
+                            (e.start_mark.line, e.start_mark.column)
+                        )
+                    elif len(st) == 2 and st[1][3] and st[1][1]:  # if question key
+                        st[1][3].cnt += 1
+                    st.append([m, m, None, s])
+                    continue
+                if isinstance(e, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    s = st.pop()[3]
+                    if s:
+                        s.fin = (e.end_mark.line, e.end_mark.column)
+                elif isinstance(e, (yaml.ScalarEvent, yaml.AliasEvent)):
+                    if st and st[-1][0]:
+                        c = st[-1]
+                        if len(st) == 1 and not c[1] and c[2] == "intro":
+                            intro = e.value
+                        if len(st) == 2 and c[3] and c[1]:  # if question key
+                            c[3].cnt += 1
+                        if c[1]:
+                            c[2] = e.value
+                else:
+                    continue
+                # completed a node inside a mapping -> key and value alternate
+                if st and st[-1][0]:
+                    st[-1][1] = not st[-1][1]
+        return QuizIndex(path, intro, sec)
+
+    def counts(self) -> dict[str, int]:
+        """return question count per section"""
+        return {k: v.cnt for k, v in self.sec.items()}
+
+    def load(self, names: list[str]) -> Quiz:
+        """return a 'Quiz' with only sections 'names', reading just their lines
+
+        the whole file is parsed if they alias anchors outside them,
+        raise 'QuizError' if a section is malformed
+        """
+        want = sorted((self.sec[n].beg, self.sec[n].fin, n) for n in names)
+        txt = {n: [] for n in names}
+        j = 0
+        with open(self.path, encoding="utf-8") as f:
+            for ln, line in enumerate(f):
+                # skip sections already passed
+                while j < len(want) and ln > want[j][1][0]:
+                    j += 1
+                if j == len(want):
+                    break
+                # take the part of line within every section covering it
+                k = j
+                while k < len(want) and want[k][0][0] <= ln:
+                    (bl, bc), (fl, fc), n = want[k]
+                    if ln <= fl:
+                        s = line[:fc] if ln == fl else line
+                        if ln == bl:  # keep column, so nested indentation holds
+                            s = " " * bc + s[bc:]
+                        txt[n].append(s)
+                    k += 1
+        try:
+            ds = {n: yaml.load("".join(txt[n]), Loader=_LOADER) or {} for n in names}
+        except yaml.composer.ComposerError:
+            # alias to an anchor outside its section -> needs the whole file
+            with open(self.path, "rb") as f:
+                full = yaml.load(f, Loader=_LOADER)
+            ds = {n: full[n] or {} for n in names}
+        sec = {}
+        for n, d in ds.items():
+            if not isinstance(d, dict):
+                raise QuizError(f"section '{n}' is not a mapping")
+            sec[n] = [Question.from_dict(k, q) for k, q in d.items()]
+        return Quiz(self.intro, sec)
@@ -0,0 +1,125 @@
+"""description for 'Matcher'"""
+
+# stdlib
+from __future__ import annotations
+import unicodedata
+
+# here
+from .quiz import Question
+
+
+_CHARS_PER_TYPO = 4  # shortest answer length that may take one more typo
+
+
+def normalize(s: str, case_sensitive=True) -> str:
+    """return 's' in the form answers are compared in"""
+    s = " ".join(unicodedata.normalize("NFKC", s).split())
+    return s if case_sensitive else s.casefold()
+
+
+def distance(a: str, b: str, lim: int) -> int:
+    """return edit distance of 'a' and 'b', or 'lim' + 1 once it is known to exceed 'lim'"""
+    if abs(len(a) - len(b)) > lim:
+        return lim + 1
+    if len(a) < len(b):
+        a, b = b, a
+    r = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        p, r[0] = r[0], i
+        m = i
+        for j, cb in enumerate(b, 1):
+            # 'p' holds the diagonal of previous row
+            p, r[j] = r[j], min(r[j] + 1, r[j - 1] + 1, p + (ca != cb))
+            if r[j] < m:
+                m = r[j]
+        if m > lim:  # row minimum never decreases
+            return lim + 1
+    return r[-1]
+
+
+class _BKTree:
+    """metric tree over answers, for lookups within an edit distance"""
+
+    __slots__ = [
+        "_rot",  # root, [word, {distance: child}]
+    ]
+
+    def __init__(self, words) -> None:
+        self._rot = None
+        for w in words:
+            self.add(w)
+
+    def add(self, w: str) -> None:
+        """add word 'w'"""
+        if self._rot is None:
+            self._rot = [w, {}]
+            return
+        n = self._rot
+        while True:
+            d = distance(w, n[0], max(len(w), len(n[0])))
+            if d == 0:
+                return
+            c = n[1].get(d)
+            if c is None:
+                n[1][d] = [w, {}]
+                return
+            n = c
+
+    def closest(self, w: str, lim: int) -> str | None:
+        """return the word nearest to 'w' within distance 'lim', 'None' if none"""
+        if self._rot is None:
+            return None
+        best, bd = None, lim + 1
+        st = [self._rot]
+        while st:
+            n = st.pop()
+            # exact distance, pruning by a capped one would skip children
+            d = distance(w, n[0], max(len(w), len(n[0])))
+            if d < bd:
+                best, bd = n[0], d
+            # triangle inequality -> only children within 'd' +- 'lim' can match
+            for k, c in n[1].items():
+                if d - lim <= k <= d + lim:
+                    st.append(c)
+        return best if bd <= lim else None
+
+
+class Matcher:
+    """answers of a question compiled for grading
+
+    exact answers are found by hash lookup, near misses by a
+    '_BKTree' when 'typos' allows any
+    """
+
+    __slots__ = [
+        "_ans",  # normalized answer -> answer as written
+        "_bkt",  # '_BKTree' of normalized answers, 'None' if no typos allowed
+        "_cas",  # case-sensitive
+        "_typ",  # most typos allowed
+    ]
+
+    def __init__(self, answers: list[str], case_sensitive=True, typos=0) -> None:
+        self._ans = {}
+        for a in answers:
+            self._ans.setdefault(normalize(a, case_sensitive), a)
+        self._bkt = _BKTree(self._ans) if typos > 0 else None
+        self._cas = case_sensitive
+        self._typ = typos
+
+    @staticmethod
+    def of(q: Question, typos=0) -> Matcher:
+        """return a 'Matcher' for question 'q'"""
+        return Matcher(q.ans, q.cas, typos)
+
+    def match(self, s: str) -> str | None:
+        """return the answer submission 's' counts as, 'None' if wrong"""
+        n = normalize(s, self._cas)
+        a = self._ans.get(n)
+        if a is not None or self._bkt is None:
+            return a
+        # scale allowed typos with length, so short answers need to be exact
+        lim = min(self._typ, len(n) // _CHARS_PER_TYPO)
+        if lim == 0:
+            return None
+        n = self._bkt.closest(n, lim)
+        return None if n is None else self._ans[n]
@@ -0,0 +1,185 @@
+"""description for 'ProgressStore'"""
+
+# stdlib
+from __future__ import annotations
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+
+_BATCH = 512  # most events written per transaction
+_LINGER = 0.05  # seconds a batch waits for more events
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    file TEXT NOT NULL,
+    section TEXT NOT NULL,
+    question TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_question ON answers (file, section, question);
+CREATE TABLE IF NOT EXISTS weights (
+    file TEXT NOT NULL,
+    section TEXT NOT NULL,
+    question TEXT NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (file, section, question)
+) WITHOUT ROWID;
+"""
+
+_INSERT_ANSWER = "INSERT INTO answers VALUES (?, ?, ?, ?, ?)"
+_UPSERT_WEIGHT = (
+    "INSERT INTO weights VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (file, section, question) DO UPDATE SET weight = excluded.weight"
+)
+
+
+def default_path() -> str:
+    """return the user data path of the progress database"""
+    base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, "quiz-tui", "progress.db")
+
+
+def _connect(path: str, **kw) -> sqlite3.Connection:
+    c = sqlite3.connect(path, isolation_level=None, uri=path.startswith("file:"), **kw)
+    c.execute("PRAGMA journal_mode=WAL")
+    c.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent, syncs on checkpoint
+    if "mode=memory" in path:
+        # shared cache locks tables, reads skip them rather than fail the writer
+        c.execute("PRAGMA read_uncommitted=1")
+    return c
+
+
+class ProgressStore:
+    """SQLite store of answers and question weights
+
+    'record' and 'set_weight' only queue the event, a writer thread
+    drains the queue and writes each batch in one transaction, the first
+    batch that fails is raised from 'flush' or 'close'
+    """
+
+    __slots__ = [
+        "_con",  # reading connection
+        "_err",  # 'sqlite3.Error' of a failed batch not yet raised, else 'None'
+        "_lck",  # lock of '_con'
+        "_pth",  # database path
+        "_que",  # queue of pending events, (statement, row) or 'None' to stop
+        "_thr",  # writer thread
+    ]
+
+    def __init__(self, path: str | None = None) -> None:
+        self._pth = path or default_path()
+        if self._pth == ":memory:":
+            # one database for both connections, gone once '_con' closes
+            self._pth = f"file:progress-{id(self)}?mode=memory&cache=shared"
+        elif not self._pth.startswith("file:"):
+            os.makedirs(os.path.dirname(os.path.abspath(self._pth)), exist_ok=True)
+        self._con = _connect(self._pth, check_same_thread=False)
+        self._con.executescript(_SCHEMA)
+        self._err = None
+        self._lck = threading.Lock()
+        self._que = queue.Queue()
+        self._thr = threading.Thread(target=self._write, name="progress", daemon=True)
+        self._thr.start()
+
+    def __enter__(self) -> ProgressStore:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _write(self) -> None:
+        """writer thread loop"""
+        c = _connect(self._pth)
+        run = True
+        while run:
+            b = [self._que.get()]
+            # gather what arrives shortly after, to share one transaction
+            end = time.monotonic() + _LINGER
+            while len(b) < _BATCH and b[-1] is not None:
+                try:
+                    b.append(self._que.get(timeout=max(0.0, end - time.monotonic())))
+                except queue.Empty:
+                    break
+            if b[-1] is None:
+                run = False
+            rows = {}
+            for e in b:
+                if e is not None:
+                    rows.setdefault(e[0], []).append(e[1])
+            try:
+                with c:  # one transaction, rolled back on error
+                    c.execute("BEGIN")
+                    for s, r in rows.items():
+                        c.executemany(s, r)
+            except sqlite3.Error as e:
+                # the game goes on, the caller learns of it on 'flush' or 'close'
+                self._err = self._err or e
+            for _ in b:
+                self._que.task_done()
+        c.close()
+
+    def _query(self, sql: str, args: tuple) -> list[tuple]:
+        with self._lck:
+            return self._con.execute(sql, args).fetchall()
+
+    def _raise(self) -> None:
+        """raise the error of a failed batch once"""
+        e, self._err = self._err, None
+        if e is not None:
+            raise e
+
+    def close(self) -> None:
+        """write pending events and stop, raise 'sqlite3.Error' if a batch failed"""
+        if self._thr.is_alive():
+            self._que.put(None)
+            self._thr.join()
+        self._con.close()
+        self._raise()
+
+    def flush(self) -> None:
+        """wait until queued events are written, raise 'sqlite3.Error' if a batch failed"""
+        self._que.join()
+        self._raise()
+
+    def record(self, file: str, section: str, question, correct: bool) -> None:
+        """queue an answer to 'question' of 'section' in quiz 'file'"""
+        self._que.put(
+            (_INSERT_ANSWER, (file, section, str(question), int(correct), time.time()))
+        )
+
+    def set_weight(self, file: str, section: str, question, weight: float) -> None:
+        """queue the weight of 'question' of 'section' in quiz 'file'"""
+        self._que.put((_UPSERT_WEIGHT, (file, section, str(question), weight)))
+
+    def question_stats(self, file: str, section: str, question) -> tuple[int, int]:
+        """return (answered, correct) of a question"""
+        (r,) = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(correct), 0) FROM answers "
+            "WHERE file = ? AND section = ? AND question = ?",
+            (file, section, str(question)),
+        )
+        return r
+
+    def file_stats(self, file: str) -> dict[str, tuple[int, int]]:
+        """return section -> (answered, correct) of quiz 'file'"""
+        return {
+            s: (n, k)
+            for s, n, k in self._query(
+                "SELECT section, COUNT(*), SUM(correct) FROM answers "
+                "WHERE file = ? GROUP BY section",
+                (file,),
+            )
+        }
+
+    def weights(self, file: str) -> dict[tuple[str, str], float]:
+        """return (section, question) -> weight of quiz 'file'"""
+        return {
+            (s, q): w
+            for s, q, w in self._query(
+                "SELECT section, question, weight FROM weights WHERE file = ?", (file,)
+            )
+        }
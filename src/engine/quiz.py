@@ -0,0 +1,125 @@
+"""description for 'Quiz'"""
+
+# stdlib
+from __future__ import annotations
+
+# yaml
+import yaml
+
+# use the libyaml bindings when built with them
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class QuizError(ValueError):
+    """quiz file content not of the quiz shape"""
+
+
+class Question:
+    """a question with the answers accepted for it"""
+
+    __slots__ = [
+        "ans",  # answers
+        "cas",  # case-sensitive
+        "inf",  # info tags
+        "key",  # key within section
+        "que",  # question
+        "wei",  # weight
+    ]
+
+    def __init__(
+        self,
+        key: int | str,
+        question: str,
+        answers: list[str],
+        info: list[str] | None = None,
+        weight=0,
+        case_sensitive=True,
+    ) -> None:
+        self.ans = answers
+        self.cas = case_sensitive
+        self.inf = info or []
+        self.key = key
+        self.que = question
+        self.wei = weight
+
+    def __repr__(self) -> str:
+        return f"Question({self.key}, {self.que!r})"
+
+    @staticmethod
+    def from_dict(key: int | str, d: dict) -> Question:
+        """return a 'Question' from its quiz file mapping, raise 'QuizError' if malformed"""
+        if not isinstance(d, dict):
+            raise QuizError(f"question '{key}' is not a mapping")
+        if "question" not in d:
+            raise QuizError(f"question '{key}' lacks 'question'")
+        for f in ("answers", "info"):
+            if not isinstance(d.get(f) or [], list):
+                raise QuizError(f"question '{key}' field '{f}' is not a list")
+        if type(d.get("weight", 0)) is not int:
+            raise QuizError(f"question '{key}' field 'weight' is not an integer")
+        return Question(
+            key,
+            d["question"],
+            [str(a) for a in d.get("answers") or []],
+            [str(i) for i in d.get("info") or []],
+            d.get("weight", 0),
+            d.get("case-sensitive", True),
+        )
+
+    @staticmethod
+    def from_row(row: list) -> Question:
+        """return a 'Question' from 'to_row' output"""
+        return Question(*row)
+
+    def to_row(self) -> list:
+        """return as a flat list, for compact storage"""
+        return [self.key, self.que, self.ans, self.inf, self.wei, self.cas]
+
+
+class Quiz:
+    """a quiz, with its intro and sections of questions"""
+
+    __slots__ = [
+        "intro",  # intro text
+        "sec",  # section name -> 'Question' list
+    ]
+
+    def __init__(self, intro: str, sections: dict[str, list[Question]]) -> None:
+        self.intro = intro
+        self.sec = sections
+
+    def __repr__(self) -> str:
+        return f"Quiz({', '.join(f'{k}: {len(v)}' for k, v in self.sec.items())})"
+
+    @staticmethod
+    def from_dict(d: dict) -> Quiz:
+        """return a 'Quiz' from its quiz file mapping, raise 'QuizError' if malformed"""
+        if d is not None and not isinstance(d, dict):
+            raise QuizError("top level is not a mapping")
+        intro = ""
+        sec = {}
+        for k, v in (d or {}).items():
+            if k == "intro":
+                intro = str(v)
+            elif isinstance(v, dict):
+                sec[str(k)] = [Question.from_dict(qk, q) for qk, q in v.items()]
+        return Quiz(intro, sec)
+
+    @staticmethod
+    def from_rows(rows: list) -> Quiz:
+        """return a 'Quiz' from 'to_rows' output"""
+        intro, sec = rows
+        return Quiz(intro, {n: [Question.from_row(q) for q in qs] for n, qs in sec})
+
+    def to_rows(self) -> list:
+        """return as nested lists, for compact storage"""
+        return [
+            self.intro,
+            [[n, [q.to_row() for q in qs]] for n, qs in self.sec.items()],
+        ]
+
+
+def load(path: str) -> Quiz:
+    """parse quiz file 'path'"""
+    with open(path, "rb") as f:
+        return Quiz.from_dict(yaml.load(f, Loader=_LOADER))
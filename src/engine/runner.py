@@ -0,0 +1,181 @@
+"""description for 'QuizRunner'"""
+
+# stdlib
+from __future__ import annotations
+from collections.abc import Iterable
+import json
+import random
+from typing import TextIO
+
+# here
+from .matcher import Matcher
+from .quiz import Question, Quiz
+from .sampler import Sampler, weight_of
+
+
+# draw weight scaled on each answer, kept within a span of the question's own weight
+_RIGHT = 0.5
+_WRONG = 2.0
+_SPAN = 8.0
+
+
+class QuizRunner:
+    """headless quiz session, grading submissions without a terminal
+
+    questions get drawn by weight, or named by (section, key); matchers
+    are built on first use and kept
+    """
+
+    __slots__ = [
+        "_cur",  # index of drawn question, 'None' if none yet
+        "_drw",  # whether any question can be drawn
+        "_ids",  # (section, key as text) -> index
+        "_lns",  # (index, matched answer) -> result as JSON line
+        "_mat",  # index -> 'Matcher', built on first use
+        "_rng",  # 'random.Random'
+        "_smp",  # 'Sampler' over questions
+        "_typ",  # most typos allowed
+        "que",  # (section, 'Question') of questions
+    ]
+
+    def __init__(
+        self, quiz: Quiz, sections: list[str] | None = None, typos=0, seed=None
+    ) -> None:
+        self.que = [
+            (s, q)
+            for s, qs in quiz.sec.items()
+            if sections is None or s in sections
+            for q in qs
+        ]
+        self._cur = None
+        self._ids = {(s, str(q.key)): i for i, (s, q) in enumerate(self.que)}
+        self._lns = {}
+        self._mat = [None] * len(self.que)
+        self._rng = random.Random(seed)
+        self._smp = Sampler.of([q for _, q in self.que])
+        self._drw = self._smp.total() > 0
+        self._typ = typos
+
+    def _match(self, i: int, answer: str) -> str | None:
+        """return the answer of question 'i' that 'answer' counts as, 'None' if wrong"""
+        m = self._mat[i]
+        if m is None:
+            m = self._mat[i] = Matcher.of(self.que[i][1], self._typ)
+        return m.match(answer)
+
+    def _result(self, i: int, a: str | None) -> dict:
+        """return result of question 'i' matched as 'a'"""
+        s, q = self.que[i]
+        return {"section": s, "key": q.key, "correct": a is not None, "match": a}
+
+    def ask(self) -> tuple[str, Question]:
+        """draw the next question, return (section, 'Question')"""
+        if not self._drw:
+            raise ValueError("'QuizRunner' has no question to draw")
+        self._cur = self._smp.sample(self._rng)
+        return self.que[self._cur]
+
+    def grade(self, answer: str, section: str | None = None, key=None) -> dict:
+        """grade 'answer' to the question of 'section' and 'key', else the one drawn last
+
+        return the result as a plain dict
+        """
+        if section is None:
+            if not self._drw:
+                return {"error": "no question to draw"}
+            if self._cur is None:
+                self.ask()
+            i = self._cur
+        else:
+            i = self._ids.get((section, str(key)))
+            if i is None:
+                return {"section": section, "key": key, "error": "no such question"}
+        return self._result(i, self._match(i, answer))
+
+    def prepare(self, section: str, key) -> None:
+        """build the matcher of the question of 'section' and 'key' ahead of its grading"""
+        i = self._ids.get((section, str(key)))
+        if i is not None and self._mat[i] is None:
+            self._mat[i] = Matcher.of(self.que[i][1], self._typ)
+
+    def reweight(self, section: str, key, correct: bool) -> float | None:
+        """scale draw weight of the question of 'section' and 'key', down if answered right, up if not
+
+        return the new weight, 'None' if no such question or one never drawn
+        """
+        i = self._ids.get((section, str(key)))
+        if i is None:
+            return None
+        b = weight_of(self.que[i][1])
+        if b <= 0:  # weighted out by its quiz file
+            return None
+        w = self._smp.weight(i) * (_RIGHT if correct else _WRONG)
+        w = min(max(w, b / _SPAN), b * _SPAN)
+        self._smp.update(i, w)
+        return w
+
+    def run(self, lines: Iterable[str], out: TextIO, ask=False) -> tuple[int, int]:
+        """grade one submission per line of 'lines', write results to 'out' as JSON lines
+
+        a line is a JSON object of 'section', 'key' and 'answer', else the
+        answer to a drawn question, drawn anew after each; if 'ask', drawn
+        questions get written before their answer is read
+        return (graded, correct), lines in error not graded
+        """
+        n = c = 0
+        dumps, loads = json.dumps, json.loads
+        ids, lns, write = self._ids, self._lns, out.write
+
+        def asked() -> dict:
+            s, q = self.ask()
+            return {"section": s, "key": q.key, "question": q.que}
+
+        if ask and self._drw:
+            write(dumps({"ask": asked()}) + "\n")
+            out.flush()
+        for ln in lines:
+            ln = ln.rstrip("\n")
+            if ln.startswith("{"):
+                try:
+                    d = loads(ln)
+                    i = ids.get((str(d["section"]), str(d["key"])))
+                    a = str(d["answer"])
+                except (ValueError, KeyError, TypeError) as e:
+                    write(dumps({"error": f"bad submission: {e}"}) + "\n")
+                    continue
+                if i is None:
+                    r = {"section": d["section"], "key": d["key"], "error": "no such question"}
+                    write(dumps(r) + "\n")
+                    continue
+            elif not self._drw:  # sections left out, or all weighted out
+                write(dumps({"error": "no question to draw"}) + "\n")
+                continue
+            else:
+                if self._cur is None:
+                    self.ask()
+                i, a = self._cur, ln
+                self._cur = None  # next plain answer gets a new question
+            n += 1
+            m = self._match(i, a)
+            c += m is not None
+            if ask:
+                r = self._result(i, m)
+                if self._cur is None and self._drw:
+                    r["ask"] = asked()
+                write(dumps(r) + "\n")
+                out.flush()
+                continue
+            # results repeat, so each line gets encoded once
+            r = lns.get((i, m))
+            if r is None:
+                r = lns[(i, m)] = dumps(self._result(i, m)) + "\n"
+            write(r)
+        return (n, c)
+
+    def set_weights(self, weights: dict[tuple[str, str], float]) -> None:
+        """set draw weights by (section, key as text), as stored by 'ProgressStore'"""
+        for k, w in weights.items():
+            i = self._ids.get(k)
+            if i is not None and weight_of(self.que[i][1]) > 0:
+                self._smp.update(i, max(w, 0.0))
+        self._drw = self._smp.total() > 0
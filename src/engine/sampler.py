@@ -0,0 +1,105 @@
+"""description for 'Sampler'"""
+
+# stdlib
+from __future__ import annotations
+from array import array
+import random
+
+# here
+from .quiz import Question
+
+
+_BASE = 1.0  # weight of a question with 'weight: 0'
+
+
+def weight_of(q: Question) -> float:
+    """return the draw weight of question 'q'"""
+    return max(0.0, _BASE + q.wei)
+
+
+class Sampler:
+    """weighted draw over a pool of items, backed by a Fenwick tree
+
+    'sample', 'update' and 'append' are O(log n)
+    """
+
+    __slots__ = [
+        "_fen",  # Fenwick tree, 1 based, node 'i' sums weights ('i' - lowbit('i'), 'i']
+        "_hib",  # highest power of two <= len
+        "_wei",  # weights
+    ]
+
+    def __init__(self, weights=()) -> None:
+        self._wei = array("d", weights)
+        # build in O(n), each node pushes its sum to its parent
+        self._fen = array("d", [0.0]) + self._wei
+        n = len(self._wei)
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                self._fen[j] += self._fen[i]
+        self._hib = 1 << (n.bit_length() - 1) if n else 0
+
+    @staticmethod
+    def of(questions: list[Question]) -> Sampler:
+        """return a 'Sampler' over 'questions', weighted by 'weight_of'"""
+        return Sampler(weight_of(q) for q in questions)
+
+    def __len__(self) -> int:
+        return len(self._wei)
+
+    def _prefix(self, i: int) -> float:
+        """return sum of the first 'i' weights"""
+        s = 0.0
+        while i:
+            s += self._fen[i]
+            i &= i - 1
+        return s
+
+    def append(self, w: float) -> int:
+        """add an item of weight 'w', return its index"""
+        self._wei.append(w)
+        i = len(self._wei)
+        # node 'i' covers the 'lowbit' items ending at it
+        self._fen.append(w + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+        if i >= self._hib << 1:
+            self._hib = i
+        return i - 1
+
+    def sample(self, rng: random.Random = random) -> int:
+        """return an index drawn in proportion to its weight"""
+        t = self.total()
+        if t <= 0:
+            raise ValueError("no weight to sample from")
+        r = rng.random() * t
+        # descend from the highest node, taking every node whose sum 'r' passes
+        i, n, b = 0, len(self._wei), self._hib
+        while b:
+            j = i + b
+            if j <= n and self._fen[j] <= r:
+                i = j
+                r -= self._fen[j]
+            b >>= 1
+        # rounding can land past the end or on a zero weight -> nearest weighted
+        i = min(i, n - 1)
+        while i and self._wei[i] <= 0:
+            i -= 1
+        return i
+
+    def total(self) -> float:
+        """return sum of all weights"""
+        return self._prefix(len(self._wei))
+
+    def update(self, i: int, w: float) -> None:
+        """set weight of item 'i' to 'w'"""
+        d = w - self._wei[i]
+        self._wei[i] = w
+        i += 1
+        n = len(self._wei)
+        while i <= n:
+            self._fen[i] += d
+            i += i & -i
+
+    def weight(self, i: int) -> float:
+        """return weight of item 'i'"""
+        return self._wei[i]
@@ -0,0 +1,198 @@
+"""description for 'Instrument'"""
+
+# stdlib
+from __future__ import annotations
+from bisect import bisect_left
+import functools
+import json
+import time
+
+# textual
+from textual.command import Hit, Hits, Provider
+from textual.screen import Screen
+from textual.widgets import Static
+
+
+_BUCKETS = (4, 8, 16, 33, 50, 100, 250)  # histogram bucket upper bounds, ms, last open
+
+
+def _bucket_names() -> list[str]:
+    return [f"<{b}ms" for b in _BUCKETS] + [f">={_BUCKETS[-1]}ms"]
+
+
+class Instrument:
+    """opt-in recorder of render and refresh costs per widget class, and of frame times
+
+    methods of the classes get wrapped while started and restored when stopped
+    """
+
+    __slots__ = [
+        "_cls",  # widget classes to record
+        "_lst",  # time of last frame
+        "_org",  # (owner, method name) -> original, of wrapped methods
+        "dur",  # frame duration histogram
+        "gap",  # frame to frame histogram
+        "ref",  # class name -> [refreshes, whole widget refreshes, cells refreshed]
+        "ren",  # class name -> [render_line calls, seconds]
+    ]
+
+    def __init__(self, classes: list[type]) -> None:
+        self._cls = classes
+        self._lst = None
+        self._org = {}
+        self.reset()
+
+    @property
+    def on(self) -> bool:
+        """whether recording"""
+        return bool(self._org)
+
+    def _wrap(self, owner: type, name: str, make) -> None:
+        org = getattr(owner, name)
+        self._org[(owner, name)] = owner.__dict__.get(name)
+        setattr(owner, name, functools.wraps(org)(make(org)))
+
+    def _wrap_frame(self, org):
+        def frame(screen) -> None:
+            t = time.perf_counter()
+            org(screen)
+            e = time.perf_counter()
+            self.dur[bisect_left(_BUCKETS, (e - t) * 1000)] += 1
+            if self._lst is not None:
+                self.gap[bisect_left(_BUCKETS, (e - self._lst) * 1000)] += 1
+            self._lst = e
+
+        return frame
+
+    def _wrap_refresh(self, org, name: str):
+        ref = self.ref.setdefault(name, [0, 0, 0])
+
+        def refresh(widget, *regions, **kw):
+            ref[0] += 1
+            if regions:
+                ref[2] += sum(r.area for r in regions)
+            else:
+                ref[1] += 1
+                ref[2] += widget.size.area
+            return org(widget, *regions, **kw)
+
+        return refresh
+
+    def _wrap_render(self, org, name: str):
+        ren = self.ren.setdefault(name, [0, 0.0])
+
+        def render_line(widget, y: int):
+            t = time.perf_counter()
+            s = org(widget, y)
+            ren[0] += 1
+            ren[1] += time.perf_counter() - t
+            return s
+
+        return render_line
+
+    def format(self) -> str:
+        """return recorded data as text, for the overlay"""
+        out = ["render_line      calls     ms"]
+        for k, (n, t) in self.ren.items():
+            out.append(f"{k[:14]:<14}{n:>8}{t * 1000:>8.1f}")
+        out.append("refresh          n  whole   cells")
+        for k, (n, w, c) in self.ref.items():
+            out.append(f"{k[:14]:<14}{n:>5}{w:>6}{c:>8}")
+        for t, h in (("frame time", self.dur), ("frame gap", self.gap)):
+            out.append(t)
+            out += [f"  {b:<8}{n:>6}" for b, n in zip(_bucket_names(), h) if n]
+        return "\n".join(out)
+
+    def report(self) -> dict:
+        """return recorded data as a plain dict"""
+        return {
+            "render_line": {k: {"calls": n, "seconds": t} for k, (n, t) in self.ren.items()},
+            "refresh": {
+                k: {"calls": n, "whole": w, "cells": c} for k, (n, w, c) in self.ref.items()
+            },
+            "frame_time_ms": dict(zip(_bucket_names(), self.dur)),
+            "frame_gap_ms": dict(zip(_bucket_names(), self.gap)),
+        }
+
+    def reset(self) -> None:
+        """clear recorded data"""
+        self.dur = [0] * (len(_BUCKETS) + 1)
+        self.gap = [0] * (len(_BUCKETS) + 1)
+        self.ref = {}
+        self.ren = {}
+        self._lst = None
+        # counters held by wrappers -> re-wrap
+        if self.on:
+            self.stop()
+            self.start()
+
+    def start(self) -> None:
+        """wrap methods and start recording"""
+        if self.on:
+            return
+        for c in self._cls:
+            self._wrap(c, "render_line", lambda o, n=c.__name__: self._wrap_render(o, n))
+            self._wrap(c, "refresh", lambda o, n=c.__name__: self._wrap_refresh(o, n))
+        self._wrap(Screen, "_compositor_refresh", self._wrap_frame)
+
+    def stop(self) -> None:
+        """restore methods and stop recording"""
+        for (owner, name), org in self._org.items():
+            if org is None:  # was inherited
+                delattr(owner, name)
+            else:
+                setattr(owner, name, org)
+        self._org = {}
+        self._lst = None
+
+
+class InstrumentOverlay(Static):
+    """live view of an 'Instrument'"""
+
+    DEFAULT_CSS = """
+        InstrumentOverlay {
+            background: $panel;
+            color: $text;
+            dock: right;
+            height: auto;
+            padding: 0 1;
+            width: auto;
+        }
+    """
+
+    _INTERVAL = 0.5  # seconds between updates
+
+    __slots__ = [
+        "_ins",  # 'Instrument' ref.
+    ]
+
+    def __init__(self, ins: Instrument) -> None:
+        super().__init__(ins.format())
+        self._ins = ins
+
+    def on_mount(self) -> None:
+        """on widget mount event"""
+        self.set_interval(self._INTERVAL, lambda: self.update(self._ins.format()))
+
+
+class InstrumentCommands(Provider):
+    """command palette entries of the instrumentation"""
+
+    async def search(self, query: str) -> Hits:
+        """return commands matching 'query'"""
+        m = self.matcher(query)
+        app = self.app
+        for name, cmd, help in (
+            ("Instrument: toggle overlay", app.action_toggle_instrument, "live render costs"),
+            ("Instrument: dump JSON", app.dump_instrument, "write render costs to a file"),
+            ("Instrument: reset", app.reset_instrument, "clear recorded render costs"),
+        ):
+            s = m.match(name)
+            if s > 0:
+                yield Hit(s, m.highlight(name), cmd, help=help)
+
+
+def dump(ins: Instrument, path: str) -> None:
+    """write data of 'ins' to 'path' as JSON"""
+    with open(path, "w") as f:
+        json.dump(ins.report(), f, indent=2)
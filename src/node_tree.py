@@ -2,17 +2,23 @@
 
 # stdlib
 from __future__ import annotations
-from collections import deque
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+import sys
 
 # rich
+from rich.cells import cell_len
 from rich.segment import Segment
 
 # textual
 from textual import events
+from textual._cache import LRUCache
 from textual.app import ComposeResult
 from textual.binding import Binding, _Bindings
 from textual.containers import Horizontal
 from textual.geometry import Region, Size
+from textual.message import Message
 from textual.reactive import reactive
 from textual.scroll_view import ScrollView
 from textual.strip import Strip
@@ -31,78 +37,553 @@ class Node:
 
     __slots__ = [
         "lab",  # label
-        "children",  # children
+        "children",  # children, or a callable returning them (lazy)
     ]
 
-    def __init__(self, label: str, children: list[Node] | None = None) -> None:
+    def __init__(
+        self,
+        label: str,
+        children: list[Node] | Callable[[], list[Node]] | None = None,
+    ) -> None:
         self.lab = label
         self.children = children
 
     def __str__(self):
         c = []
+        if self.is_lazy():
+            return f"Node({self.lab}, ...)"
         if self.children:
             for e in self.children:
                 c.append(e.__str__())
         return f"Node({self.lab}, {c if len(c) else None})"
 
+    def is_lazy(self) -> bool:
+        """return whether children are yet to be loaded"""
+        return callable(self.children)
+
+    def load(self) -> list[Node] | None:
+        """load children if lazy, then return them"""
+        if self.is_lazy():
+            self.children = self.children()
+        return self.children
+
+
+class TreeProvider:
+    """how 'NodeTree' reads its items, 'Node'(s) by default
+
+    subclass to show any data model as is, no copy into 'Node'(s); items
+    are told apart by identity, their children are read once, when their
+    parent first expands
+    """
+
+    __slots__ = []
+
+    def _listed(self, item) -> list | None:
+        """load children of 'Node' 'item', kept on it as a list so they read again"""
+        c = item.load()
+        if c is not None and not isinstance(c, list):
+            c = item.children = list(c)
+        return c
+
+    def children(self, item) -> Iterable | Callable[[], Iterable] | None:
+        """return children of 'item', or a callable returning them, 'None' if none
 
-class _NodeSliver:
-    _CHILD_PREFIX_LAST = "└──"
-    _CHILD_PREFIX_MIDDLE = "├──"
-    _MARK_PREFIX = "▪"
+        children can be any iterable, a generator too
+        """
+        return self._listed(item)
+
+    def is_leaf(self, item) -> bool:
+        """return whether 'item' holds no children, checked without loading them"""
+        return not (item.is_lazy() or item.children)
+
+    def label(self, item) -> str:
+        """return label of 'item'"""
+        return item.lab
+
+    # changes made through 'NodeTree', a read only model can leave these out
+
+    def append(self, item, children: list) -> None:
+        """append 'children' to those of 'item'"""
+        c = self._listed(item)
+        if c is None:
+            c = item.children = []
+        c.extend(children)
+
+    def relabel(self, item, label: str) -> None:
+        """set label of 'item'"""
+        item.lab = label
+
+    def remove(self, item, child) -> None:
+        """remove 'child' from children of 'item'"""
+        self._listed(item).remove(child)
+
+
+class _NodeSliverTree:
+    """collapsible tree of node slivers, stored column wise, with an index of visible rows"""
+
+    _CHILD_PREFIX_LAST = "└── "
+    _CHILD_PREFIX_MIDDLE = "├── "
+    _MARK_PREFIX = "▪ "
     _PARENT_PREFIX_LAST = "│   "
     _PARENT_PREFIX_MIDDLE = "    "
-    _SPACE = " "
+
+    # expand states, a leaf is 'COLLAPSED' as it has nothing to load
+    UNLOADED = 0
+    COLLAPSED = 1
+    EXPANDED = 2
 
     __slots__ = [
-        "atr",  # attribute
+        # columns, one entry per loaded node in tree order
+        "atr",  # attribute, 1 if parent
+        "cnt",  # selected leaves in subtree
         "dep",  # depth
-        "end",  # ending
-        "lab",  # label
-        "par",  # parent
-        "pre",  # prefix
-        "sel",  # selected
+        "end",  # ending, 1 if last child
+        "exp",  # expand state
+        "nod",  # item ref.
+        "par",  # parent index, -1 if root
+        "pre",  # prefix, interned
+        "sel",  # selected, bitset
+        "sub",  # index past subtree
+        # other
+        "_ids",  # item id -> index, 'None' until needed after a splice
+        "_ipr",  # interned prefixes, (parent prefix, parent ending, ending) -> prefix
+        "_sof",  # search text offset per index
+        "_stx",  # search text, casefolded labels joined, 'None' until needed after a change
+        "prv",  # 'TreeProvider' of items
+        "vis",  # visible row -> index
+        "_wct",  # width -> count, of visible rows
+        "wid",  # width of widest visible row, in cells
     ]
 
-    def __init__(
-        self,
-        depth: int,
-        label: str,
-        parent: _NodeSliver | None = None,
-        ending=False,
-        attribute: str | None = None,
-    ) -> None:
-        self.atr = attribute
-        self.dep = depth
-        self.end = ending
-        self.lab = label
-        self.par = parent
-        self.pre = self._prefix()
-        self.sel = False
-
-    def _prefix(self) -> str:
-        # if root-node
-        if self.dep == 0:
-            return _NodeSliver._MARK_PREFIX + _NodeSliver._SPACE
-        # if child-node
-        pre = deque()
-        pre.appendleft(_NodeSliver._SPACE)
-        pre.appendleft(
-            _NodeSliver._CHILD_PREFIX_LAST
-            if self.end
-            else _NodeSliver._CHILD_PREFIX_MIDDLE
-        )
-        # prefix according to parent-nodes
-        p = self.par
-        while p and p.par:
-            pre.appendleft(
-                _NodeSliver._PARENT_PREFIX_MIDDLE
-                if p.end
-                else _NodeSliver._PARENT_PREFIX_LAST
-            )
-            p = p.par
-        # complete prefix
-        return "".join(pre)
+    def __init__(self, nodes: list, provider: TreeProvider | None = None) -> None:
+        self.atr = bytearray()
+        self.cnt = array("l")
+        self.dep = array("H")
+        self.end = bytearray()
+        self.exp = bytearray()
+        self.nod = []
+        self.par = array("l")
+        self.pre = []
+        self.prv = provider or TreeProvider()
+        self.sel = 0
+        self.sub = array("l")
+        self._ids = None
+        self._ipr = {}
+        self._sof = array("l")
+        self._stx = None
+        self.vis = []
+        self._wct = {}
+        self.wid = 0
+        self._insert(0, nodes, -1)
+        self.vis = list(range(len(self.nod)))
+        self._show(self.vis)
+        # roots start expanded, their children collapsed
+        for r in range(len(self.vis) - 1, -1, -1):
+            self.expand(r)
+
+    def __len__(self) -> int:
+        return len(self.vis)
+
+    def _hide(self, ix) -> None:
+        """uncount widths of indexes 'ix' leaving the visible rows"""
+        wct = self._wct
+        for i in ix:
+            w = self._width(i)
+            wct[w] -= 1
+            if not wct[w]:
+                del wct[w]
+        if self.wid not in wct:  # widest gone -> next widest
+            self.wid = max(wct, default=0)
+
+    def _prefix(self, pp: str | None, pe: int, end: int) -> str:
+        """return prefix for a child, derived from parent prefix 'pp' and ending 'pe'"""
+        if pp is None:  # if root-node
+            return self._MARK_PREFIX
+        k = (pp, pe, end)
+        pre = self._ipr.get(k)
+        if pre is None:
+            c = self._CHILD_PREFIX_LAST if end else self._CHILD_PREFIX_MIDDLE
+            if pp == self._MARK_PREFIX:  # if child of root-node
+                pre = c
+            else:  # continue parent's connector as a line
+                pre = (
+                    pp[: -len(c)]
+                    + (self._PARENT_PREFIX_MIDDLE if pe else self._PARENT_PREFIX_LAST)
+                    + c
+                )
+            pre = self._ipr[k] = sys.intern(pre)
+        return pre
+
+    def _top_selected(self, i: int, e: int) -> int:
+        """return selected leaves in rows 'i' to 'e', being whole subtrees"""
+        n = 0
+        while i < e:
+            n += self.cnt[i] if self.atr[i] else (self.sel >> i) & 1
+            i = self.sub[i]
+        return n
+
+    def _show(self, ix) -> None:
+        """count widths of indexes 'ix' joining the visible rows"""
+        wct = self._wct
+        for i in ix:
+            w = self._width(i)
+            wct[w] = wct.get(w, 0) + 1
+            if w > self.wid:
+                self.wid = w
+
+    def _shown(self, i: int, e: int) -> list[int]:
+        """return visible indexes in rows 'i' to 'e'"""
+        return self.vis[bisect_left(self.vis, i) : bisect_left(self.vis, e)]
+
+    def _splice(self, i: int, e: int, c: tuple, p: int) -> int:
+        """replace rows 'i' to 'e' under parent 'p' with columns 'c', return change in row count"""
+        atr, cnt, dep, end, exp, nod, par, pre, sel, sub = c
+        # selected leaves leaving -> correct parent counts after
+        ds = -self._top_selected(i, e)
+        self.atr[i:e] = atr
+        self.cnt[i:e] = array("l", cnt)
+        self.dep[i:e] = array("H", dep)
+        self.end[i:e] = end
+        self.exp[i:e] = exp
+        self.nod[i:e] = nod
+        self.par[i:e] = array("l", par)
+        self.pre[i:e] = pre
+        self.sel = util.bits_splice(self.sel, i, e, sel, len(nod))
+        self.sub[i:e] = array("l", sub)
+        k = len(nod) - (e - i)
+        ds += self._top_selected(i, i + len(nod))
+        self._ids = None
+        self._stx = None
+        # shift indexes past splice
+        j = i + len(nod)
+        if k and j < len(self.par):
+            self.par[j:] = array("l", [q + k if q >= e else q for q in self.par[j:]])
+            self.sub[j:] = array("l", [q + k for q in self.sub[j:]])
+        if k:
+            vis = self.vis
+            for r in range(bisect_left(vis, e), len(vis)):
+                vis[r] += k
+        # grow ancestors
+        while p != -1:
+            self.sub[p] += k
+            self.cnt[p] += ds
+            p = self.par[p]
+        return k
+
+    def _children(self, n) -> list:
+        """return children of item 'n' read from provider"""
+        c = self.prv.children(n)
+        if callable(c):
+            c = c()
+        return c if isinstance(c, list) else list(c or ())
+
+    def _insert(self, i: int, nodes: list, p: int) -> int:
+        """insert one level of items at 'i' as children of 'p', return count"""
+        k = len(nodes)
+        if not k:
+            return 0
+        d = self.dep[p] + 1 if p != -1 else 0
+        pp, pe = (self.pre[p], self.end[p]) if p != -1 else (None, 0)
+        leaf = self.prv.is_leaf
+        atr = bytearray(0 if leaf(n) else 1 for n in nodes)
+        end = bytearray(k)
+        end[-1] = 1  # if last child
+        exp = bytes(self.COLLAPSED if not a else self.UNLOADED for a in atr)
+        pre = [self._prefix(pp, pe, 0)] * (k - 1) + [self._prefix(pp, pe, 1)]
+        sub = range(i + 1, i + 1 + k)
+        c = (atr, [0] * k, [d] * k, end, exp, nodes, [p] * k, pre, 0, sub)
+        return self._splice(i, i, c, p)
+
+    def _load(self, i: int) -> None:
+        """load children of parent 'i'"""
+        if self.exp[i] != self.UNLOADED:
+            return
+        self._insert(i + 1, self._children(self.nod[i]), i)
+        self.exp[i] = self.COLLAPSED
+
+    def _reprefix(self, i: int, e: int) -> None:
+        """derive prefixes of rows 'i' to 'e' again from their parents"""
+        for j in range(i, e):
+            p = self.par[j]
+            self.pre[j] = self._prefix(self.pre[p], self.end[p], self.end[j])
+
+    def _visible(self, i: int) -> list[int]:
+        """return indexes of rows visible below expanded 'i'"""
+        atr, exp, sub = self.atr, self.exp, self.sub
+        v = []
+        e = sub[i]
+        j = i + 1
+        while j < e:
+            v.append(j)
+            if atr[j] and exp[j] != self.EXPANDED:
+                j = sub[j]  # skip collapsed subtree
+            else:
+                j += 1
+        return v
+
+    def _width(self, i: int) -> int:
+        """return width of row of index 'i', in cells"""
+        return cell_len(self.pre[i]) + cell_len(self.prv.label(self.nod[i]))
+
+    def add(self, i: int, nodes: list) -> tuple[int | None, list[int]]:
+        """add 'nodes', already appended to children of item of 'i', as last children
+
+        return (visible row of first added, parents deselected in turn),
+        row is 'None' if not shown
+        """
+        u = []
+        if not self.atr[i]:  # if leaf -> parent yet to load
+            if (self.sel >> i) & 1:  # parents hold no select of own
+                self.sel &= ~(1 << i)
+                u.append(i)
+                q = self.par[i]
+                while q != -1:  # no longer a selected leaf
+                    self.cnt[q] -= 1
+                    q = self.par[q]
+            self.atr[i] = 1
+            self.exp[i] = self.UNLOADED
+            if self.par[i] == -1:  # roots start expanded
+                self.expand(self.row(i))
+                return (self.row(i) + 1, u)
+        if self.exp[i] == self.UNLOADED:  # children join on load
+            return (None, u)
+        e = self.sub[i]
+        if e > i + 1:  # previous last child -> middle child
+            j = i + 1
+            while self.sub[j] < e:
+                j = self.sub[j]
+            self.end[j] = 0
+            v = self._shown(j, self.sub[j])
+            self._hide(v)
+            self._reprefix(j, self.sub[j])
+            self._show(v)
+        # added leaves come unselected -> selected ancestors no longer are
+        p = i
+        while p != -1:
+            if (self.sel >> p) & 1:
+                self.sel &= ~(1 << p)
+                u.append(p)
+            p = self.par[p]
+        k = self._insert(e, nodes, i)
+        # if collapsed, or hidden below a collapsed ancestor -> not shown
+        if self.exp[i] != self.EXPANDED or self.row(i) is None:
+            return (None, u)
+        v = bisect_left(self.vis, e)
+        self.vis[v:v] = range(e, e + k)
+        self._show(range(e, e + k))
+        return (v, u)
+
+    def collapse(self, r: int) -> bool:
+        """collapse parent on row 'r'"""
+        i = self.vis[r]
+        if self.exp[i] != self.EXPANDED:
+            return False
+        self.exp[i] = self.COLLAPSED
+        e = bisect_left(self.vis, self.sub[i], r + 1)
+        self._hide(self.vis[r + 1 : e])
+        del self.vis[r + 1 : e]
+        return True
+
+    def expand(self, r: int) -> bool:
+        """expand parent on row 'r', loading its children first time"""
+        i = self.vis[r]
+        if not self.atr[i] or self.exp[i] == self.EXPANDED:
+            return False
+        self._load(i)
+        self.exp[i] = self.EXPANDED
+        v = self._visible(i)
+        self.vis[r + 1 : r + 1] = v
+        self._show(v)
+        return True
+
+    def find(self, q: str, i: int, back=False) -> int | None:
+        """return index of next label holding 'q' from 'i' on (before 'i' if 'back'), wrapping
+
+        'q' is to be casefolded, 'None' if no label holds it
+        """
+        if self._stx is None:  # one string, so 'str.find' does the scan
+            lab = [self.prv.label(n).casefold() for n in self.nod]
+            self._sof = array("l", [0]) * len(lab)
+            o = 0
+            for j, t in enumerate(lab):
+                self._sof[j] = o
+                o += len(t) + 1
+            self._stx = "\n".join(lab)
+        t, o = self._stx, self._sof
+        if not o:
+            return None
+        i = min(i, len(o))
+        s = o[i] if i < len(o) else len(t)
+        if back:
+            k = t.rfind(q, 0, s)
+            if k == -1:
+                k = t.rfind(q, s)
+        else:
+            k = t.find(q, s)
+            if k == -1:
+                k = t.find(q, 0, s)
+        return None if k == -1 else bisect_right(o, k) - 1
+
+    def index(self, n) -> int | None:
+        """return index of item 'n', 'None' if not loaded"""
+        if self._ids is None:
+            self._ids = {id(m): j for j, m in enumerate(self.nod)}
+        return self._ids.get(id(n))
+
+    def label(self, i: int) -> str:
+        """return label of index 'i'"""
+        return self.prv.label(self.nod[i])
+
+    def leaves(self, i: int) -> int:
+        """return count of loaded leaves in subtree of 'i'"""
+        if not self.atr[i]:
+            return 1
+        e = self.sub[i]
+        return (e - i - 1) - self.atr.count(1, i + 1, e)
+
+    def load_all(self, i: int) -> int:
+        """load the whole subtree of 'i', return index past it"""
+        e = self.sub[i]
+        if self.exp.find(self.UNLOADED, i, e) == -1:  # if nothing to load
+            return e
+        # rebuild subtree, loaded rows kept with their state, only the rest read from provider
+        o2n = {}  # old index -> new index
+        c = tuple([] for _ in range(10))
+        atr, cnt, dep, end, exp, nod, par, pre, sel, sub = c
+        leaf = self.prv.is_leaf
+
+        def kids(m, j: int | None) -> tuple[list, list]:
+            """return (children, their old indexes or 'None'(s)) of item 'm' at old index 'j'"""
+            if j is None or self.exp[j] == self.UNLOADED:
+                ch = self._children(m)
+                return (ch, [None] * len(ch))
+            ix, k, e = [], j + 1, self.sub[j]
+            while k < e:
+                ix.append(k)
+                k = self.sub[k]
+            return ([self.nod[k] for k in ix], ix)
+
+        def walk(n, oj: int | None, p: int, pp: str, pe: int, d: int) -> None:
+            ch, ix = kids(n, oj)
+            for k, (m, j) in enumerate(zip(ch, ix)):
+                ni = i + 1 + len(nod)
+                a = self.atr[j] if j is not None else 0 if leaf(m) else 1
+                atr.append(a)
+                dep.append(d)
+                end.append(1 if k == len(ch) - 1 else 0)
+                nod.append(m)
+                par.append(p)
+                pre.append(self._prefix(pp, pe, end[-1]))
+                sub.append(0)
+                if j is None:
+                    cnt.append(0)
+                    exp.append(self.COLLAPSED)
+                    sel.append("0")
+                else:
+                    o2n[j] = ni
+                    cnt.append(self.cnt[j])
+                    exp.append(self.exp[j] or self.COLLAPSED)
+                    sel.append("1" if (self.sel >> j) & 1 else "0")
+                if a:
+                    walk(m, j, ni, pre[-1], end[-1], d + 1)
+                sub[ni - i - 1] = i + 1 + len(nod)
+
+        walk(self.nod[i], i, i, self.pre[i], self.end[i], self.dep[i] + 1)
+        self.exp[i] = self.exp[i] or self.COLLAPSED
+        c = c[:8] + (int("".join(reversed(sel)) or "0", 2),) + c[9:]
+        # splice, then remap visible rows inside subtree
+        r, s = bisect_right(self.vis, i), bisect_left(self.vis, e)
+        self._splice(i + 1, e, c, i)
+        self.vis[r:s] = [o2n[j] for j in self.vis[r:s]]
+        return self.sub[i]
+
+    def remove(self, i: int) -> tuple[int, int, int]:
+        """remove 'i' and its subtree, return (visible row it was on, visible rows gone, selected leaves gone)"""
+        p, e = self.par[i], self.sub[i]
+        n = self._top_selected(i, e)
+        last = self.end[i]
+        r = bisect_left(self.vis, i)
+        h = bisect_left(self.vis, e, r) - r
+        self._hide(self.vis[r : r + h])
+        del self.vis[r : r + h]
+        self._splice(i, e, (b"", (), (), b"", b"", [], (), [], 0, ()), p)
+        if p == -1:
+            return (r, h, n)
+        if self.sub[p] == p + 1:  # no children left -> leaf
+            self.atr[p] = 0
+            self.exp[p] = self.COLLAPSED
+            self.sel &= ~(1 << p)
+        elif last:  # previous child -> last child
+            j = p + 1
+            while self.sub[j] < self.sub[p]:
+                j = self.sub[j]
+            self.end[j] = 1
+            v = self._shown(j, self.sub[j])
+            self._hide(v)
+            self._reprefix(j, self.sub[j])
+            self._show(v)
+        return (r, h, n)
+
+    def relabel(self, n, lab: str) -> int | None:
+        """set label of item 'n', return its index, 'None' if not loaded"""
+        i = self.index(n)
+        v = [i] if i is not None and self.row(i) is not None else []
+        self._hide(v)
+        self.prv.relabel(n, lab)
+        self._show(v)
+        self._stx = None
+        return i
+
+    def parent_row(self, r: int) -> int | None:
+        """return row of the parent to row 'r'"""
+        p = self.par[self.vis[r]]
+        return None if p == -1 else self.row(p)
+
+    def reveal(self, i: int) -> None:
+        """expand ancestors of 'i' so it is visible"""
+        a = []
+        p = self.par[i]
+        while p != -1:
+            a.append(p)
+            p = self.par[p]
+        for p in reversed(a):
+            r = self.row(p)
+            if r is not None:
+                self.expand(r)
+
+    def row(self, i: int) -> int | None:
+        """return row of index 'i', 'None' if hidden"""
+        r = bisect_left(self.vis, i)
+        if r < len(self.vis) and self.vis[r] == i:
+            return r
+        return None
+
+    def select(self, i: int, s: int, subtree=True) -> list[int]:
+        """set select state 's' on 'i' (and its subtree), return parents deselected in turn"""
+        e = self.sub[i] if subtree else i + 1
+        d = -self._top_selected(i, e)  # change in selected leaves
+        self.sel = util.bits_set(self.sel, i, e, s)
+        # counts inside subtree
+        if self.atr[i] and subtree:
+            q = i
+            while q != -1:
+                self.cnt[q] = self.leaves(q) if s else 0
+                q = self.atr.find(1, q + 1, e)
+        d += self._top_selected(i, e)
+        # counts of ancestors, if child unselect -> unselect parent(s)
+        u = []
+        p = self.par[i]
+        while p != -1:
+            self.cnt[p] += d
+            if not s and (self.sel >> p) & 1:
+                self.sel &= ~(1 << p)
+                u.append(p)
+            p = self.par[p]
+        return u
+
+    def selected(self, i: int) -> int:
+        """return select state of 'i'"""
+        return (self.sel >> i) & 1
 
 
 class _NodeSliverStack(ScrollView):
@@ -110,6 +591,7 @@ class _NodeSliverStack(ScrollView):
         "_node-sliver-stack--default",
         "_node-sliver-stack--parent",
         "_node-sliver-stack--child-select",
+        "_node-sliver-stack--match",
     }
 
     DEFAULT_CSS = """
@@ -129,32 +611,55 @@ class _NodeSliverStack(ScrollView):
             background: $accent;
             text-style: italic;
         }
+        _NodeSliverStack > ._node-sliver-stack--match {
+            color: $warning;
+            text-style: bold underline;
+        }
     """
 
+    _CACHE_SIZE = 1024  # rendered rows to keep
+
     __slots__ = [
-        "ns",  # '_NodeSliver' list
+        "_cac",  # render cache, index -> (row key, 'Strip')
+        "_drt",  # dirty spans, (row, past row, x, past x), flushed once per frame
+        "nt",  # '_NodeSliverTree' ref.
+        "qry",  # search query, casefolded, to highlight
         "_typ",  # selection type
     ]
 
-    def __init__(self, ns: list[_NodeSliver], typ: str):
+    def __init__(self, nt: _NodeSliverTree, typ: str):
+        self._drt = []
         super().__init__()
-        self.ns = ns
+        self._cac = LRUCache(self._CACHE_SIZE)
+        self.nt = nt
+        self.qry = ""
         self._typ = typ
         if typ == "none":
             self.styles.overflow_y = "hidden"
         else:
-            self.virtual_size = Size(0, len(ns))
+            self.virtual_size = Size(0, len(nt))
         self.styles.max_width = self._get_width()
 
+    def _flush_rows(self) -> None:
+        """repaint dirty spans, merged where rows touch or overlap"""
+        if not self._drt:
+            return
+        d, self._drt = sorted(self._drt), []
+        m = [list(d[0])]
+        for y, e, x, xe in d[1:]:
+            c = m[-1]
+            if y <= c[1]:  # touching or overlapping rows -> one region
+                c[1] = max(c[1], e)
+                c[2] = min(c[2], x)
+                c[3] = max(c[3], xe)
+            else:
+                m.append([y, e, x, xe])
+        o = -self.scroll_offset
+        self.refresh(*(Region(x, y, xe - x, e - y).translate(o) for y, e, x, xe in m))
+
     def _get_width(self) -> int:
-        # calculate width
-        f = self.ns[0]
-        w = len(f.pre + f.lab)
-        for i in range(1, len(self.ns)):
-            c = self.ns[i]
-            sw = len(c.pre + c.lab)  # width of a sliver
-            if sw > w:
-                w = sw
+        # width of widest visible row, tracked by tree
+        w = self.nt.wid
         if self._typ == "none":
             return w
         return w + _SPACE + self.styles.scrollbar_size_vertical
@@ -166,56 +671,117 @@ class _NodeSliverStack(ScrollView):
     def render_line(self, y: int) -> Strip:
         ofs_x, ofs_y = self.scroll_offset
         y += ofs_y  # so correct row is accessed
+        # render blank after last row
+        if y >= len(self.nt):
+            return Strip.blank(self.size.width)
+        nt = self.nt
+        i = nt.vis[y]
+        # if cached and row unchanged
+        lab = nt.label(i)
+        # span of label matching search
+        m = lab.casefold().find(self.qry) if self.qry else -1
+        q = len(self.qry) if m != -1 else 0  # highlight spans the query
+        k = (nt.pre[i], lab, nt.atr[i], nt.selected(i), m, q, ofs_x, self.size.width)
+        c = self._cac.get(i)
+        if c is not None and c[0] == k:
+            return c[1]
         # styling on selected
-        s = self.ns[y]
         st = None
-        if s.atr == "parent":
+        if nt.atr[i]:
             st = self.get_component_rich_style("_node-sliver-stack--parent")
         else:
-            if s.sel:
+            if nt.selected(i):
                 st = self.get_component_rich_style("_node-sliver-stack--child-select")
         # formulate and ship row
         d = self.get_component_rich_style("_node-sliver-stack--default")
-        seg = [Segment(s.pre, d), Segment(s.lab, st if st else d)]
-        return Strip(seg).crop(ofs_x, ofs_x + self.size.width)
+        st = st if st else d
+        if m == -1:
+            seg = [Segment(nt.pre[i], d), Segment(lab, st)]
+        else:
+            e = m + len(self.qry)
+            if len(lab.casefold()) != len(lab):  # folding moved offsets -> whole label
+                m, e = 0, len(lab)
+            ms = st + self.get_component_rich_style("_node-sliver-stack--match")
+            seg = [
+                Segment(nt.pre[i], d),
+                Segment(lab[:m], st),
+                Segment(lab[m:e], ms),
+                Segment(lab[e:], st),
+            ]
+        strip = Strip(seg).crop(ofs_x, ofs_x + self.size.width)
+        self._cac[i] = (k, strip)
+        return strip
+
+    def resize(self) -> None:
+        """fit size to visible rows"""
+        if self._typ != "none":
+            self.virtual_size = Size(0, len(self.nt))
+        self.styles.max_width = self._get_width()
+        self.refresh()
+
+    def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self._cac.clear()
+
+    def refresh(self, *regions: Region, repaint=True, layout=False) -> _NodeSliverStack:
+        if repaint and not regions:  # whole widget repaints -> dirty spans too
+            self._drt.clear()
+        return super().refresh(*regions, repaint=repaint, layout=layout)
+
+    def mark_rows(self, y: int, e: int, x: int, xe: int) -> None:
+        """mark rows 'y' to 'e', columns 'x' to 'xe', for repaint on next frame"""
+        if not self._drt:
+            self.call_after_refresh(self._flush_rows)
+        self._drt.append((y, e, x, xe))
+
+    def update_rows(self, i: int, e: int) -> None:
+        """render rows of indexes 'i' to 'e' again, as one region"""
+        y = bisect_left(self.nt.vis, i)
+        h = bisect_left(self.nt.vis, e, y) - y
+        if h:
+            self.mark_rows(y, y + h, 0, self.size.width)
 
     def update_row(self, i: int) -> None:
-        """render row 'i' again"""
-        e = self.ns[i]
-        x = len(e.pre)
-        y = i
-        w = len(e.lab)
-        h = i if i else 1
-        region = Region(x, y, w, h).translate(-self.scroll_offset)
-        self.refresh(region)
+        """render row of index 'i' again"""
+        self._cac.discard(i)
+        y = self.nt.row(i)
+        if y is None:  # if hidden
+            return
+        # only the label changes look
+        x = cell_len(self.nt.pre[i])
+        self.mark_rows(y, y + 1, x, x + cell_len(self.nt.label(i)))
 
 
 class _SelectableNodeSliverStack(Horizontal):
     _POINTER = "▶"
 
-    _i = reactive(0)  # index for pointed row in '_NodeSliverStack'
+    _i = reactive(0, repaint=False)  # index for pointed row in '_NodeSliverStack'
 
     __slots__ = [
         "_aut",  # auto select
         "_hei",  # heigh cache
+        "_mov",  # pointer moved, flush waiting
         "_ofs",  # offset to pointer symbol from widget top
+        "_n",  # selected count
+        "_pnd",  # pointed item, to tell a shifted pointer from a moved one
         "_pnt",  # pointer
-        "si",  # selected index(ex)
         "_typ",  # selection type
         "nss",  # '_NodeSliverStack' ref.
     ]
 
-    def __init__(self, ns: list[_NodeSliver], typ: str, auto: bool) -> None:
+    def __init__(self, nt: _NodeSliverTree, typ: str, auto: bool) -> None:
         super().__init__()
         if typ != "none":
             self._aut = auto
             self._hei = self.size.height
+            self._mov = False
             self._ofs = 0
             self._pnt = Label(self._POINTER)
             self._pnt.styles.margin = (0, 2, 0, 0)
-            self.si = [] if typ == "multi" else None
+            self._n = 0
+            self._pnd = None
         self._typ = typ
-        self.nss = _NodeSliverStack(ns, typ)
+        self.nss = _NodeSliverStack(nt, typ)
         self.styles.max_width = self._get_width()
 
     def _on_resize(self, event: events.Resize) -> None:
@@ -241,113 +807,270 @@ class _SelectableNodeSliverStack(Horizontal):
             return self.nss.styles.width
         return len(self._POINTER) + _SPACE + self.nss.styles.max_width.value
 
-    def _watch__i(self, i: int) -> None:
-        if self._typ == "none":
+    def _scroll_by(self, d: int) -> int:
+        """scroll tree 'd' rows as far as it goes, return rows it will scroll"""
+        # scroll lands after next refresh -> its target worked out here
+        y = self.nss.scroll_y
+        t = util.clamp(y + d, 0, self.nss.max_scroll_y)
+        self.nss.scroll_to(y=t, animate=False, force=True)
+        return round(t - y)
+
+    def _shift_pnt(self, d: int) -> None:
+        """move pointer 'd' rows, scrolling along so it stays on screen where it can"""
+        self.nss.resize()
+        # what scroll could not take, pointer takes, tree grows to fit it
+        self._ofs = max(self._ofs + d - self._scroll_by(d), 0)
+        self._i += d
+
+    def _sync_pnt(self) -> None:
+        """realign pointer with row '_i' after scroll settled"""
+        self._ofs = util.clamp(
+            self._i - round(self.nss.scroll_y), 0, max(self.size.height - 1, 0)
+        )
+        self._pnt.styles.offset = (0, self._ofs)
+
+    def _on_tree_change(self) -> None:
+        """fit to the tree after rows were shown or hidden"""
+        self.nss.resize()
+        self.styles.max_width = self._get_width()
+        self.parent.resize()
+        if self._typ != "none":
+            self.call_after_refresh(self._sync_pnt)
+
+    def _flush_pnt(self) -> None:
+        """apply pointer moves since last flush, once per frame"""
+        self._mov = False
+        nt = self.nss.nt
+        if not len(nt):
             return
+        i = self._i = min(self._i, len(nt) - 1)
         # update pointer offset
         self._pnt.styles.offset = (0, self._ofs)
         # scroll shortest distance to row 'i'
         self.nss.scroll_to_region(Region(0, i, 0, 1), animate=False, force=True)
-        # if auto select
-        if self._aut:
+        # if auto select, and not the same node moved by rows added above
+        n = nt.nod[nt.vis[i]]
+        if self._aut and n is not self._pnd:
             self.pnt_select()
+        self._pnd = n
+
+    def _watch__i(self, i: int) -> None:
+        if self._typ == "none" or self._mov:
+            return
+        # key repeat moves pile up until the screen settled -> one scroll, select and paint
+        self._mov = True
+        self.call_after_refresh(self._flush_pnt)
+
+    def add(self, batch: list[tuple[object, list]]) -> None:
+        """append children to items, in order, showing those loaded in tree"""
+        nt = self.nss.nt
+        d = 0  # rows shown above pointer
+        for n, ch in batch:
+            nt.prv.append(n, ch)
+            i = nt.index(n)
+            if i is None:  # if not loaded, joins tree on load
+                continue
+            r, u = nt.add(i, ch)
+            if r is not None and r <= self._i and self._typ != "none":
+                d += len(ch)
+            for p in u:  # deselected parents
+                self.nss.update_row(p)
+        if d:  # keep pointer on its row
+            self._shift_pnt(d)
+        self._on_tree_change()
+
+    def relabel(self, batch: list[tuple[object, str]]) -> None:
+        """give items new labels"""
+        nt = self.nss.nt
+        for n, lab in batch:
+            i = nt.relabel(n, lab)
+            if i is not None:
+                self.nss.update_rows(i, i + 1)
+        self._on_tree_change()
+
+    def remove(self, batch: list[tuple[object, list]]) -> None:
+        """remove children from items, and from tree if loaded"""
+        nt = self.nss.nt
+        pi = self._i  # pointer row after removal
+        gone = 0  # selected leaves removed
+        for n, ch in batch:
+            for c in ch:
+                nt.prv.remove(n, c)
+                i = nt.index(c)
+                if i is None:
+                    continue
+                r, h, k = nt.remove(i)
+                gone += k
+                if pi >= r + h:  # if below -> follow its row
+                    pi -= h
+                elif pi >= r:  # if removed -> take row that came in place
+                    pi = max(min(r, len(nt) - 1), 0)
+        if self._typ != "none":
+            if pi != self._i:
+                self._shift_pnt(pi - self._i)
+            # if pointed item removed, pointer now on the one in place
+            n = nt.nod[nt.vis[self._i]] if len(nt) else None
+            if n is not self._pnd:
+                self._pnd = n
+                if self._aut and n is not None:
+                    self.pnt_select()
+            if gone:
+                if self._typ == "multi":
+                    self._n -= gone
+                    self.parent.update_select_count(self._n)
+                self.parent.post_message(NodeTree.Changed(self.parent))
+        self._on_tree_change()
+
+    def collapse(self, r: int) -> bool:
+        """collapse parent on row 'r'"""
+        if not self.nss.nt.collapse(r):
+            return False
+        self._on_tree_change()
+        return True
+
+    def expand(self, r: int) -> bool:
+        """expand parent on row 'r'"""
+        if not self.nss.nt.expand(r):
+            return False
+        self._on_tree_change()
+        return True
 
     def get_selected(self) -> list[str]:
         """return labels of selected nodes"""
-        return [self.nss.ns[i].lab for i in self.si]
+        lab = self.nss.nt.prv.label
+        return [lab(n) for n in self.get_selected_nodes()]
+
+    def get_selected_nodes(self) -> list:
+        """return selected nodes"""
+        nt = self.nss.nt
+        return [nt.nod[i] for i in util.bits_indexes(nt.sel) if not nt.atr[i]]
+
+    def pnt_collapse(self) -> None:
+        """collapse pointed node in tree, or go to its parent"""
+        if self.collapse(self._i):
+            return
+        r = self.nss.nt.parent_row(self._i)
+        if r is not None:
+            self._ofs = max(self._ofs - (self._i - r), 0)
+            self._i = r
+
+    def pnt_expand(self) -> bool:
+        """expand pointed node in tree"""
+        return self.expand(self._i)
+
+    def pnt_find(self, q: str, step=0) -> bool:
+        """point to next row holding 'q', from pointed row on ('step' 0), after (1) or before (-1)
+
+        rows hidden in collapsed parents get revealed, return whether any holds 'q'
+        """
+        nt = self.nss.nt
+        q = q.casefold()
+        if not q or not len(nt):
+            return False
+        if not self.nss.qry:  # search starts -> take in all of tree
+            for r in range(len(nt) - 1, -1, -1):
+                i = nt.vis[r]
+                if nt.par[i] == -1 and nt.atr[i]:
+                    nt.load_all(i)
+        i = nt.vis[self._i]
+        j = nt.find(q, i + (step == 1), back=step == -1)
+        if j is None:
+            return False
+        self.nss.qry = q
+        if nt.row(j) is None:
+            nt.reveal(j)
+            self._on_tree_change()
+        r = nt.row(j)
+        self._ofs = util.clamp(self._ofs + r - self._i, 0, max(self.size.height - 1, 0))
+        self._i = r
+        self.nss.refresh()
+        self.call_after_refresh(self._sync_pnt)
+        return True
+
+    def pnt_find_end(self) -> None:
+        """stop search highlight"""
+        if self.nss.qry:
+            self.nss.qry = ""
+            self.nss.refresh()
 
     def pnt_jump_end(self) -> None:
         """jump to tree end"""
         self._ofs = self.size.height - 1
-        self._i = len(self.nss.ns) - 1
+        self._i = len(self.nss.nt) - 1
 
     def pnt_jump_start(self) -> None:
         """jump to tree start"""
         self._ofs = 0
         self._i = 0
 
+    def pnt_move(self, d: int) -> None:
+        """go 'd' rows down in tree, up if negative, in one step"""
+        d = util.clamp(self._i + d, 0, max(len(self.nss.nt) - 1, 0)) - self._i
+        if not d:
+            return
+        self._ofs = util.clamp(self._ofs + d, 0, max(self.size.height - 1, 0))
+        self._i += d
+
     def pnt_next(self) -> None:
         """go down in tree"""
-        if self._ofs < self.size.height - 1:
-            self._ofs += 1
-        if self._i < len(self.nss.ns) - 1:
-            self._i += 1
+        self.pnt_move(1)
+
+    def pnt_page(self, n: int) -> None:
+        """go 'n' pages down in tree, up if negative, pointer keeping its place on screen"""
+        h = max(self.size.height, 1)
+        d = util.clamp(self._i + n * h, 0, max(len(self.nss.nt) - 1, 0)) - self._i
+        if not d:
+            return
+        # what scroll could not take, pointer takes
+        self._ofs = util.clamp(self._ofs + d - self._scroll_by(d), 0, h - 1)
+        self._i += d
 
     def pnt_previous(self) -> None:
         """go up in tree"""
-        if self._ofs > 0:
-            self._ofs -= 1
-        if self._i > 0:
-            self._i -= 1
+        self.pnt_move(-1)
 
     def pnt_select(self) -> None:
         """select a node in tree"""
-        self.select(self._i)
+        self.select(self.nss.nt.vis[self._i])
 
     def select(self, i: int) -> None:
-        """select row 'i'"""
-
-        def update_sel_indexes(i: int, sel: bool, si: list[int]):
-            (s, pos) = util.bin_search(si, i)
-            if s and not sel:
-                si.pop(pos)
-            elif not s:
-                si.insert(pos, i)
-
-        ns = self.nss.ns  # '_NodeSliver' list
-        c = ns[i]  # current selected '_NodeSliver'
+        """select node of index 'i'"""
+        nt = self.nss.nt  # '_NodeSliverTree' ref.
 
         # single select
         if self._typ == "single":
+            o = nt.sel.bit_length() - 1  # index of previous select, -1 if none
             # if on parent, single don't allow multi select, deselect any
-            if c.atr == "parent" and self._aut and self.si is not None:
-                ns[self.si].sel = False
-                self.nss.update_row(self.si)
-                self.si = None
+            if nt.atr[i] and self._aut and o != -1:
+                nt.select(o, 0, subtree=False)
+                self.nss.update_row(o)
+                self.parent.post_message(NodeTree.Changed(self.parent))
                 return
 
-            c.sel = not c.sel
+            nt.select(i, not nt.selected(i), subtree=False)
             self.nss.update_row(i)
 
-            # if no select or did not reselect same -> setup 'i' as selected index
-            if self.si is None or self.si != i:
-                if self.si is not None:  # on replace
-                    ns[self.si].sel = False
-                    self.nss.update_row(self.si)
-            self.si = i
+            # if did not reselect same -> deselect previous
+            if o != -1 and o != i:
+                nt.select(o, 0, subtree=False)
+                self.nss.update_row(o)
+            self.parent.post_message(NodeTree.Changed(self.parent))
 
         # multi select
         else:
-            si = self.si.copy()  # snapshot to work on (catching overselect)
-            updates = [(i, not c.sel)]  # row indexes with future select states
-
-            # parent select state -> child select state
-            if c.atr == "parent":
-                for _i in range(i + 1, len(ns)):
-                    n = ns[_i]
-                    if n.dep <= c.dep:
-                        break
-                    if not n.atr == "parent":
-                        update_sel_indexes(_i, not c.sel, si)
-                    updates.append((_i, not c.sel))
-            else:
-                update_sel_indexes(i, not c.sel, si)
-            # if child unselect -> unselect parent(s)
-            if c.sel:
-                for _i in range(i - 1, -1, -1):
-                    p = ns[_i]
-                    if p.dep >= c.dep:  # if not direct family
-                        continue
-                    if not p.sel:  # if parent unselected
-                        break
-                    updates.append((_i, False))
-                    c = p
+            # parent select state -> child select state, so load all children
+            e = nt.load_all(i) if nt.atr[i] else i + 1
+            s = 0 if nt.selected(i) else 1  # future select state
+            # count changing leaves
+            c = nt.cnt[i] if nt.atr[i] else nt.selected(i)
+            n = self._n + nt.leaves(i) - c if s else self._n - c
             # check againsts selection limit
-            if self.parent.update_select_count(len(si)):
-                self.si = si
-                for _i, s in updates:
-                    ns[_i].sel = s
-                    self.nss.update_row(_i)
+            if self.parent.update_select_count(n):
+                self._n = n
+                for p in nt.select(i, s):  # deselected parents
+                    self.nss.update_row(p)
+                self.nss.update_rows(i, e)
+                self.parent.post_message(NodeTree.Changed(self.parent))
 
     def compose(self) -> ComposeResult:
         if self._typ != "none":
@@ -434,13 +1157,29 @@ class _InfoBar(Widget):
 
 
 class NodeTree(Horizontal):
-    """displaying a tree of nodes"""
+    """displaying a tree of 'Node'(s), or of any items read through a 'TreeProvider'"""
+
+    class Changed(Message):
+        """posted when selection changed"""
+
+        def __init__(self, tree: NodeTree) -> None:
+            super().__init__()
+            self.tree = tree
 
     _BINDINGS = [
         Binding("down", "next", "Down"),
         Binding("up", "previous", "Up"),
         Binding("end", "end", "End", show=False),
         Binding("home", "start", "Start", show=False),
+        Binding("pagedown", "page(1)", "Page down", show=False),
+        Binding("pageup", "page(-1)", "Page up", show=False),
+        Binding("ctrl+down", "move(10)", "Down 10", show=False),
+        Binding("ctrl+up", "move(-10)", "Up 10", show=False),
+        Binding("left", "collapse", "Collapse", show=False),
+        Binding("right", "expand", "Expand", show=False),
+        Binding("ctrl+n", "find_next", "Next match", show=False),
+        Binding("ctrl+p", "find_previous", "Previous match", show=False),
+        Binding("escape", "find_end", "End search", show=False),
         Binding("space", "select", "Select"),
     ]
 
@@ -452,37 +1191,77 @@ class NodeTree(Horizontal):
         }
     """
 
+    _SEARCH_CHARS = "._-/()"  # besides alphanumerics, characters that type-ahead
+    _SEARCH_TIMEOUT = 1.5  # seconds of no typing that end a search
+
     __slots__ = [
         "_a_sel",  # auto select
         "_ib",  # '_InfoBar' ref.
         "_lim",  # selection limit
+        "_qry",  # search query typed
         "_snss",  # '_SelectableNodeSliverStack' ref.
+        "_tmr",  # search timeout 'Timer'
         "_typ",  # selection type
     ]
 
     def __init__(
-        self, nodes: list[Node], selection="multi", auto_select=False, limit=-1
+        self,
+        nodes: list,
+        selection="multi",
+        auto_select=False,
+        limit=-1,
+        provider: TreeProvider | None = None,
     ) -> None:
         super().__init__()
         self._a_sel = auto_select
         self._lim = limit
+        self._qry = ""
+        self._tmr = None
         self._handle_selection(selection)
-        self._ib = _InfoBar(limit)
+        self._ib = _InfoBar(self._lim)
         self._snss = _SelectableNodeSliverStack(
-            self._nodes_to_slivers(nodes), selection, auto_select
+            _NodeSliverTree(nodes, provider), selection, auto_select
         )
         self._typ = selection
-        self.styles.max_height = len(self._snss.nss.ns)
-        self.styles.max_width = self._snss.styles.max_width
+        self.resize()
+
+    def _action_collapse(self) -> None:
+        """collapse node in tree"""
+        self._snss.pnt_collapse()
 
     def _action_end(self) -> None:
         """jump to tree end"""
         self._snss.pnt_jump_end()
 
+    def _action_expand(self) -> None:
+        """expand node in tree"""
+        self._snss.pnt_expand()
+
+    def _action_find_end(self) -> None:
+        """end search"""
+        self._qry = ""
+        self._snss.pnt_find_end()
+
+    def _action_find_next(self) -> None:
+        """go to next search match"""
+        self._find(self._qry, 1)
+
+    def _action_find_previous(self) -> None:
+        """go to previous search match"""
+        self._find(self._qry, -1)
+
+    def _action_move(self, d: int) -> None:
+        """go 'd' rows down in tree, up if negative"""
+        self._snss.pnt_move(d)
+
     def _action_next(self) -> None:
         """go down in tree"""
         self._snss.pnt_next()
 
+    def _action_page(self, n: int) -> None:
+        """go 'n' pages down in tree, up if negative"""
+        self._snss.pnt_page(n)
+
     def _action_previous(self) -> None:
         """go up in tree"""
         self._snss.pnt_previous()
@@ -495,12 +1274,24 @@ class NodeTree(Horizontal):
         """jump to tree start"""
         self._snss.pnt_jump_start()
 
+    def _find(self, q: str, step=0) -> None:
+        """point to a row holding 'q', keep search open a while"""
+        if not q:
+            return
+        if self._snss.pnt_find(q, step):
+            self._qry = q
+        else:
+            self.app.bell()
+        if self._tmr is not None:
+            self._tmr.stop()
+        self._tmr = self.set_timer(self._SEARCH_TIMEOUT, self._action_find_end)
+
     def _handle_selection(self, sel: str) -> None:
         """setup according to 'sel'"""
         match sel:
             case "multi":
                 self._a_sel = False
-                self.lim = self.lim if self.lim > 0 else -1
+                self._lim = self._lim if self._lim > 0 else -1
                 self._bindings = _Bindings(self._BINDINGS)
                 self.can_focus = True
             case "single":
@@ -509,48 +1300,67 @@ class NodeTree(Horizontal):
                     self._bindings = _Bindings(self._BINDINGS[:-1])
                 self.can_focus = True
             case "none":
-                self.lim = 0
+                self._lim = 0
             case _:
                 raise ValueError(
                     "'NodeTree' parameter 'selection' got non of "
                     + f'["multi", "single", "none"] instead: "{sel}"'
                 )
 
-    @staticmethod
-    def _nodes_to_slivers(nodes: list[Node]) -> list[_NodeSliver]:
-        """work through list of 'Node'(s), unfold and parse into '_NodeSliver'(s)"""
-
-        def _node_to_slivers(
-            root: Node, depth=0, parent: _NodeSliver | None = None, ending=False
-        ) -> _NodeSliver:
-            """recursively yield '_NodeSliver'(s) translated from 'Node'(s)"""
-            # if no child -> child or lone root
-            if not root.children:
-                if depth == 0:
-                    ending = True
-                yield _NodeSliver(depth, root.lab, parent, ending)
-            else:  # if parent
-                ns = _NodeSliver(depth, root.lab, parent, ending, attribute="parent")
-                yield ns
-                for i, c in enumerate(root.children):
-                    end = False
-                    if i == len(root.children) - 1:
-                        end = True  # if last child
-                    print(c.lab)
-                    # explore
-                    yield from _node_to_slivers(c, depth + 1, ns, end)
-
-        # generate '_NodeSliver'(s) from every node, combine to one collection
-        return [e for n in nodes for e in _node_to_slivers(n)]
+    def resize(self) -> None:
+        """fit size to current tree"""
+        self.styles.max_height = len(self._snss.nss.nt)
+        w = int(self._snss.styles.max_width.value)
+        if self._typ == "multi":  # make room for '_InfoBar' in its layer
+            ib = int(self._ib.styles.width.value)
+            self._snss.styles.margin = (0, ib, 0, 0)
+            w += ib
+        self.styles.max_width = w
+
+    def add_children(self, batch: list[tuple[object, list]]) -> None:
+        """append children to items in tree, in order of 'batch', through provider
+
+        an item added in 'batch' can take children later in it
+        """
+        self._snss.add(batch)
+
+    def relabel(self, batch: list[tuple[object, str]]) -> None:
+        """give items in tree new labels, through provider"""
+        self._snss.relabel(batch)
+
+    def remove_children(self, batch: list[tuple[object, list]]) -> None:
+        """remove children from items in tree, through provider, selection and pointer kept on what stays"""
+        self._snss.remove(batch)
 
     def get_selected(self) -> list[str]:
         """return labels of selected nodes"""
         return self._snss.get_selected()
 
+    def on_key(self, event: events.Key) -> None:
+        """type-ahead search, label characters extend query"""
+        c = event.character
+        if event.key == "backspace" and self._qry:
+            q = self._qry[:-1]
+        elif c is not None and (c.isalnum() or c in self._SEARCH_CHARS):
+            q = self._qry + c
+        else:
+            return
+        event.stop()
+        event.prevent_default()
+        if q:
+            self._find(q)
+        else:
+            self._action_find_end()
+
+    def get_selected_nodes(self) -> list:
+        """return selected nodes"""
+        return self._snss.get_selected_nodes()
+
     def update_select_count(self, count: int) -> bool:
         """try update select count"""
         if self._ib.lim == -1 or count <= self._ib.lim:
             self._ib.n = count
+            self.resize()
             return True
         self._ib.flash_red()
         return False
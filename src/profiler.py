@@ -0,0 +1,152 @@
+"""description for 'StartupProfiler'"""
+
+# stdlib
+from __future__ import annotations
+import functools
+import importlib
+import sys
+import time
+
+
+# imported in order so each time only counts what the module adds
+_MODULES = [
+    "yaml",
+    "msgpack",
+    "rich",
+    "textual.app",
+    "textual.widgets",
+    "src.utils",
+    "src.node_tree",
+    "src.other",
+    "src.notched_widgets",
+    "src.scanner",
+    "src.engine.quiz",
+    "src.engine.index",
+    "src.engine.matcher",
+    "src.engine.sampler",
+    "src.engine.runner",
+    "src.windows.file_window",
+    "src.windows.quiz_window",
+    "src.windows.game_window",
+    "src.app",
+]
+
+# 'module:class' of widgets to time
+_WIDGETS = [
+    "src.app:Home",
+    "src.notched_widgets:NotchedWidgets",
+    "src.windows.file_window:FileWindow",
+    "src.windows.quiz_window:QuizWindow",
+    "src.windows.game_window:GameWindow",
+    "src.node_tree:NodeTree",
+]
+
+
+class StartupProfiler:
+    """timer of app startup: module imports, widget construction and first paint
+
+    times are seconds since the profiler was made, so make it first
+    """
+
+    __slots__ = [
+        "_t0",  # start time
+        "con",  # widget name -> [constructed, total construction time]
+        "imp",  # module -> import time
+        "pnt",  # widget name -> time of first paint
+        "rdy",  # time the home screen painted
+    ]
+
+    def __init__(self) -> None:
+        self._t0 = time.perf_counter()
+        self.con = {}
+        self.imp = {}
+        self.pnt = {}
+        self.rdy = None
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._t0
+
+    def _time_init(self, cls: type) -> None:
+        init = cls.__init__
+        con = self.con.setdefault(cls.__name__, [0, 0.0])
+
+        @functools.wraps(init)
+        def timed(*args, **kw) -> None:
+            t = time.perf_counter()
+            init(*args, **kw)
+            con[0] += 1
+            con[1] += time.perf_counter() - t
+
+        cls.__init__ = timed
+
+    def _time_paint(self, classes: tuple[type, ...]) -> None:
+        from textual.widget import Widget
+
+        render_lines = Widget.render_lines
+        pnt = self.pnt
+
+        @functools.wraps(render_lines)
+        def timed(widget, crop):
+            n = type(widget).__name__
+            if n not in pnt and isinstance(widget, classes):
+                pnt[n] = self._now()
+            return render_lines(widget, crop)
+
+        Widget.render_lines = timed
+
+    def import_app(self):
+        """import the app modules, timing each, and return the 'QuizTUI' class"""
+        for m in _MODULES:
+            if m in sys.modules:
+                continue
+            t = time.perf_counter()
+            importlib.import_module(m)
+            self.imp[m] = time.perf_counter() - t
+        classes = []
+        for w in _WIDGETS:
+            m, c = w.split(":")
+            cls = getattr(sys.modules[m], c)
+            self._time_init(cls)
+            classes.append(cls)
+        self._time_paint(tuple(classes))
+        return sys.modules["src.app"].QuizTUI
+
+    def run(self, headless=False) -> None:
+        """run the app until the home screen first painted"""
+        app_cls = self.import_app()
+        home = sys.modules["src.app"].Home
+        prof = self
+
+        def on_mount(screen) -> None:
+            def ready() -> None:
+                prof.rdy = prof._now()
+                screen.app.exit()
+
+            screen.call_after_refresh(ready)
+
+        home.on_mount = on_mount
+        app_cls().run(headless=headless)
+
+    def report(self) -> dict:
+        """return times as a plain dict"""
+        return {
+            "import": dict(self.imp),
+            "import_total": sum(self.imp.values()),
+            "construct": {k: {"count": n, "time": t} for k, (n, t) in self.con.items()},
+            "first_paint": dict(self.pnt),
+            "ready": self.rdy,
+        }
+
+    def format(self) -> str:
+        """return times as a readable table"""
+        ms = lambda t: f"{t * 1000:9.2f} ms"
+        out = ["import"]
+        out += [f"  {m:<28}{ms(t)}" for m, t in self.imp.items()]
+        out.append(f"  {'total':<28}{ms(sum(self.imp.values()))}")
+        out.append("construct")
+        out += [f"  {k + f' x{n}':<28}{ms(t)}" for k, (n, t) in self.con.items()]
+        out.append("first paint (since start)")
+        out += [f"  {k:<28}{ms(t)}" for k, t in self.pnt.items()]
+        if self.rdy is not None:
+            out.append(f"  {'home ready':<28}{ms(self.rdy)}")
+        return "\n".join(out)
@@ -0,0 +1,150 @@
+"""description for 'DirScanner'"""
+
+# stdlib
+from collections import deque
+from collections.abc import Callable, Iterator
+import os
+
+# here
+from .node_tree import Node
+
+
+class PathNode(Node):
+    """'Node' of a file system entry"""
+
+    __slots__ = [
+        "isd",  # is directory
+        "pth",  # path
+    ]
+
+    def __init__(self, label: str, children, path: str, is_dir=False) -> None:
+        super().__init__(label, children)
+        self.isd = is_dir
+        self.pth = path
+
+
+def _dir_label(path: str) -> str:
+    """return label of directory 'path'"""
+    # "./quizes/example" -> "/example"
+    return "/" + os.path.basename(os.path.normpath(path))
+
+
+class DirScanner:
+    """reader of a quiz directory that scans each directory once, on demand"""
+
+    __slots__ = [
+        "_cac",  # cache, directory path -> entries
+        "_ext",  # file extension to keep
+        "_mti",  # directory path -> modify time when read
+    ]
+
+    def __init__(self, ext=".yml") -> None:
+        self._cac = {}
+        self._ext = ext
+        self._mti = {}
+
+    def _read(self, path: str) -> list[tuple[str, bool, int]]:
+        e = []
+        try:
+            # time taken before listing -> a change while listing shows later
+            self._mti[path] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                for d in it:
+                    try:
+                        # 'DirEntry' caches type and inode from the listing, no extra 'stat'
+                        if d.is_dir():
+                            e.append((d.name, True, d.inode()))
+                        elif d.name.endswith(self._ext):
+                            e.append((d.name, False, d.inode()))
+                    except OSError:
+                        continue
+        except OSError:  # unreadable or vanished directory -> treat as empty
+            pass
+        return e
+
+    def _forget(self, path: str) -> None:
+        """drop directory 'path' and below from cache"""
+        for m in (self._cac, self._mti):
+            for k in [k for k in m if k == path or k.startswith(path + "/")]:
+                del m[k]
+
+    def _move(self, old: str, new: str) -> None:
+        """re-key directory 'old' and below in cache as 'new'"""
+        for m in (self._cac, self._mti):
+            for k in [k for k in m if k == old or k.startswith(old + "/")]:
+                m[new + k[len(old) :]] = m.pop(k)
+
+    def changed(self, path: str) -> bool:
+        """return whether directory 'path' got modified since read"""
+        try:
+            return os.stat(path).st_mtime_ns != self._mti.get(path)
+        except OSError:  # vanished -> its parent tells
+            return False
+
+    def dirs(self) -> list[str]:
+        """return paths of directories read"""
+        return list(self._cac)
+
+    def rescan(
+        self, path: str
+    ) -> tuple[list[tuple[str, bool]], list[str], list[tuple[str, str]]]:
+        """read directory 'path' again, return (added, removed, renamed) entries since read
+
+        a name gone and another come with the same inode is a rename
+        """
+        if path not in self._cac:  # if never read, nothing to compare
+            return ([], [], [])
+        o = {n: (d, i) for n, d, i in self._cac[path]}
+        new = self._cac[path] = self._read(path)
+        w = {n: (d, i) for n, d, i in new}
+        gone = {o[n][1]: n for n in o.keys() - w.keys()}
+        add, ren = [], []
+        for n, d, i in new:
+            if n in o and o[n][0] == d:
+                continue
+            r = gone.get(i) if n not in o else None
+            if r is not None and o[r][0] == d:
+                del gone[i]
+                ren.append((r, n))
+                if d:
+                    self._move(f"{path}/{r}", f"{path}/{n}")
+            else:
+                add.append((n, d))
+        # left gone, or replaced by another type under same name
+        rem = list(gone.values()) + [n for n, _ in add if n in o]
+        for n in rem:
+            if o[n][0]:
+                self._forget(f"{path}/{n}")
+        return (add, rem, ren)
+
+    def scan(self, path: str) -> list[tuple[str, bool, int]]:
+        """return (name, is directory, inode) for entries in 'path', read once then cached"""
+        e = self._cac.get(path)
+        if e is None:
+            e = self._cac[path] = self._read(path)
+        return e
+
+    def walk(
+        self, root: PathNode, cancelled: Callable[[], bool] | None = None
+    ) -> Iterator[tuple[PathNode, list[PathNode]]]:
+        """scan below directory 'root' breadth first, yield (directory, new children)
+
+        children are yielded, not added, so the caller decides when they
+        join the tree, directories get an empty list to add to
+        """
+        q = deque([root])
+        while q:
+            if cancelled and cancelled():
+                return
+            d = q.popleft()
+            ch = []
+            for n, isd, _ in self.scan(d.pth):
+                p = f"{d.pth}/{n}"
+                if isd:
+                    c = PathNode(_dir_label(p), [], p, True)
+                    q.append(c)
+                else:
+                    c = PathNode(n, None, p)
+                ch.append(c)
+            if ch:
+                yield d, ch
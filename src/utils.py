@@ -23,3 +23,30 @@ def bin_search(arr, target) -> (int, int):
         elif arr[m] == target:
             return (1, m)
     return (0, m + f)
+
+
+def bits_indexes(b: int) -> list[int]:
+    """return indexes of set bits in bitset 'b'"""
+    s = bin(b)[:1:-1]  # bit 0 first
+    i = s.find("1")
+    ix = []
+    while i != -1:
+        ix.append(i)
+        i = s.find("1", i + 1)
+    return ix
+
+
+def bits_range(b: int, i: int, e: int) -> int:
+    """return bits 'i' to 'e' of bitset 'b', moved down to bit 0"""
+    return (b >> i) & ((1 << (e - i)) - 1)
+
+
+def bits_set(b: int, i: int, e: int, v: int) -> int:
+    """return bitset 'b' with bits 'i' to 'e' set to 'v'"""
+    m = ((1 << (e - i)) - 1) << i
+    return b | m if v else b & ~m
+
+
+def bits_splice(b: int, i: int, e: int, c: int, k: int) -> int:
+    """return bitset 'b' with bits 'i' to 'e' replaced by the 'k' low bits of 'c'"""
+    return (b & ((1 << i) - 1)) | (c << i) | ((b >> e) << (i + k))
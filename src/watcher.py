@@ -0,0 +1,180 @@
+"""description for 'DirWatcher'"""
+
+# stdlib
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+# here
+from .scanner import DirScanner
+
+
+# inotify event bits, from <sys/inotify.h>
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_MASK = _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+_EVENT = struct.Struct("iIII")  # watch, mask, cookie, name length
+
+
+class _Inotify:
+    """minimal inotify binding, telling which watched directories changed"""
+
+    __slots__ = [
+        "_fd",  # inotify file descriptor
+        "_lib",  # libc
+        "_wds",  # watch -> directory path
+    ]
+
+    def __init__(self) -> None:
+        self._lib = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._lib.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._wds = {}
+
+    def add(self, path: str) -> None:
+        """watch directory 'path'"""
+        wd = self._lib.inotify_add_watch(self._fd, os.fsencode(path), _IN_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch", path)
+        self._wds[wd] = path
+
+    def close(self) -> None:
+        """stop watching"""
+        os.close(self._fd)
+
+    def move(self, old: str, new: str) -> None:
+        """re-key watches of 'old' and below as 'new', watches follow the inode"""
+        for wd, p in self._wds.items():
+            if p == old or p.startswith(old + "/"):
+                self._wds[wd] = new + p[len(old) :]
+
+    def paths(self) -> set[str]:
+        """return watched directory paths"""
+        return set(self._wds.values())
+
+    def read(self, timeout: float) -> set[str] | None:
+        """wait up to 'timeout' for events, return changed directories, 'None' if events got lost"""
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+        ch = set()
+        lost = False
+        while True:
+            try:
+                b = os.read(self._fd, 1 << 16)
+            except BlockingIOError:
+                break
+            i = 0
+            while i < len(b):
+                wd, mask, _, n = _EVENT.unpack_from(b, i)
+                i += _EVENT.size + n
+                if mask & _IN_Q_OVERFLOW:
+                    lost = True
+                elif mask & _IN_IGNORED:  # directory gone
+                    self._wds.pop(wd, None)
+                elif wd in self._wds:
+                    ch.add(self._wds[wd])
+        return None if lost else ch
+
+
+class DirWatcher:
+    """detector of changes below the directories a 'DirScanner' read
+
+    uses inotify where available, else polls directory modify times
+    """
+
+    _POLL = 1.0  # seconds between polls, and between cancel checks
+
+    __slots__ = [
+        "_ino",  # '_Inotify', 'None' if polling
+        "_scn",  # 'DirScanner' ref.
+    ]
+
+    def __init__(self, scanner: DirScanner) -> None:
+        self._scn = scanner
+        self._ino = None
+        if sys.platform.startswith("linux"):
+            try:
+                self._ino = _Inotify()
+            except (OSError, AttributeError):  # no inotify -> poll
+                self._ino = None
+
+    def _diff(
+        self, paths
+    ) -> list[tuple[str, list[tuple[str, bool]], list[str], list[tuple[str, str]]]]:
+        """return (directory, added, removed, renamed) of directories 'paths' that changed"""
+        ch = []
+        for p in sorted(paths):  # parents first
+            add, rem, ren = self._scn.rescan(p)
+            if add or rem or ren:
+                ch.append((p, add, rem, ren))
+                if self._ino:
+                    for o, n in ren:
+                        self._ino.move(f"{p}/{o}", f"{p}/{n}")
+        return ch
+
+    def _sync(self) -> list[str] | None:
+        """watch directories read since last call, return them, 'None' if out of watches"""
+        new = list(set(self._scn.dirs()) - self._ino.paths())
+        try:
+            for p in new:
+                self._ino.add(p)
+        except OSError:  # out of watches -> poll instead
+            self._ino.close()
+            self._ino = None
+            return None
+        return new
+
+    def close(self) -> None:
+        """stop watching"""
+        if self._ino:
+            self._ino.close()
+            self._ino = None
+
+    def watch(
+        self, cancelled: Callable[[], bool]
+    ) -> Iterator[
+        list[tuple[str, list[tuple[str, bool]], list[str], list[tuple[str, str]]]]
+    ]:
+        """yield changes as (directory, added, removed, renamed) until 'cancelled'
+
+        new directories need reading by the caller, through the same
+        'DirScanner', to be watched in turn
+        """
+        # anything changed between the read and the first watch
+        if self._ino:
+            self._sync()
+        first = self._diff([p for p in self._scn.dirs() if self._scn.changed(p)])
+        if first:
+            yield first
+        try:
+            while not cancelled():
+                new = self._sync() if self._ino else None
+                if new is not None:
+                    p = self._ino.read(self._POLL)
+                    if p is None:  # events lost -> check all
+                        p = [q for q in self._scn.dirs() if self._scn.changed(q)]
+                    else:
+                        d = set(self._scn.dirs())
+                        p = {q for q in p if q in d}
+                        # changed between read and watch
+                        p.update(q for q in new if self._scn.changed(q))
+                else:
+                    time.sleep(self._POLL)
+                    p = [q for q in self._scn.dirs() if self._scn.changed(q)]
+                ch = self._diff(p)
+                if ch:
+                    yield ch
+        finally:
+            self.close()
@@ -1,16 +1,20 @@
 """description for 'FileWindow'"""
 
 # stdlib
-import os
-import re
+import time
 
 # textual
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal
+from textual.message import Message as _Message
+from textual.worker import get_current_worker
 
 # here
 from ..node_tree import Node, NodeTree
 from ..other import Center, Divider, Message
+from ..scanner import DirScanner, PathNode, _dir_label
+from ..watcher import DirWatcher
 
 
 PATH = "quizes_test"
@@ -22,29 +26,154 @@ class FileWindow(Horizontal):
 
     DEFAULT_CLASSES = "window"
 
+    class Picked(_Message):
+        """posted when a quiz file got picked, or unpicked"""
+
+        def __init__(self, path: str | None) -> None:
+            super().__init__()
+            self.path = path
+
+    _FLUSH = 0.05  # seconds between adding scanned batches to tree
     _MSG = "Select a file to read quizes from"
+    _MSG_SCAN = "Scanning... {} files in {} directories"
+
+    __slots__ = [
+        "_dir",  # directory path -> 'PathNode', of those in tree
+        "_msg",  # 'Message' ref.
+        "_n",  # root 'Node'
+        "_nt",  # 'NodeTree' ref.
+        "_pik",  # path last posted as 'Picked'
+        "_scn",  # 'DirScanner' ref.
+    ]
 
     def __init__(self, root: str) -> None:
         super().__init__()
-        self._n = self._build(root)  # node
-
-    def _build(self, root: str) -> Node:
-        c = []
-        for e in os.listdir(root):
-            path = f"{root}/{e}"
-            if os.path.isdir(path):
-                c.append(self._build(path))
-            elif e.endswith(".yml"):
-                c.append(Node(e, None))
-        # regex: "./quizes/example" -> "example"
-        return Node("/" + re.search(r"[^\/]+$", root).group(), c if len(c) else None)
+        self._msg = Message(self._MSG_SCAN.format(0, 0))
+        # filled by 'scan', so a slow file system never blocks
+        self._n = PathNode(_dir_label(root), [], root, True)
+        self._nt = NodeTree(
+            [Node("first", None), self._n], "single", auto_select=True, limit=15
+        )
+        self._pik = None
+        self._scn = DirScanner()
+        self._dir = {root: self._n}
+
+    def _add(self, batch: list, files: int, dirs: int, done: bool) -> None:
+        """add a scanned batch to tree and show progress"""
+        if batch:
+            self._add_batch(batch)
+        self._msg.update(self._MSG if done else self._MSG_SCAN.format(files, dirs))
+
+    def _add_batch(self, batch: list[tuple[PathNode, list[PathNode]]]) -> None:
+        self._nt.add_children(batch)
+        for _, ch in batch:
+            self._dir.update((c.pth, c) for c in ch if c.isd)
+
+    def _apply(self, changes: list) -> None:
+        """apply changes found by 'DirWatcher' to tree"""
+        add, rem, ren = [], [], []
+        for path, new, gone, moved, below in changes:
+            d = self._dir.get(path)
+            if d is None:  # if below a directory gone
+                continue
+            ch = {c.pth: c for c in d.children}
+            g = [ch[f"{path}/{n}"] for n in gone if f"{path}/{n}" in ch]
+            if g:
+                rem.append((d, g))
+            for o, n in moved:
+                c = ch.get(f"{path}/{o}")
+                if c is not None:
+                    ren.append((c, _dir_label(n) if c.isd else n))
+                    self._repath(c, f"{path}/{n}")
+            if new:
+                add.append((d, new))
+            add += below
+        if rem:
+            self._nt.remove_children(rem)
+            for _, g in rem:
+                for c in g:
+                    if c.isd:
+                        self._forget(c.pth)
+        if ren:
+            self._nt.relabel(ren)
+        if add:
+            self._add_batch(add)
+        self._pick()
+
+    def _forget(self, path: str) -> None:
+        """drop directory 'path' and below from '_dir'"""
+        for k in [k for k in self._dir if k == path or k.startswith(path + "/")]:
+            del self._dir[k]
+
+    def _pick(self) -> None:
+        """post 'Picked' if picked path changed"""
+        n = self._nt.get_selected_nodes()
+        p = n[0].pth if n and isinstance(n[0], PathNode) and not n[0].isd else None
+        if p != self._pik:
+            self._pik = p
+            self.post_message(self.Picked(p))
+
+    def _repath(self, n: PathNode, path: str) -> None:
+        """move 'n' and its loaded subtree to 'path'"""
+        if n.isd:
+            self._dir.pop(n.pth, None)
+            self._dir[path] = n
+        old, n.pth = n.pth, path
+        if n.isd and isinstance(n.children, list):
+            for c in n.children:
+                self._repath(c, path + c.pth[len(old) :])
+
+    def on_mount(self) -> None:
+        """on widget mount event"""
+        self.scan()
+
+    def on_node_tree_changed(self, event: NodeTree.Changed) -> None:
+        """on 'NodeTree' selection change"""
+        event.stop()
+        self._pick()
+
+    @work(thread=True, exclusive=True)
+    def scan(self) -> None:
+        """scan the quiz directory, adding what is found to tree in batches, then watch it"""
+        w = get_current_worker()
+        batch = []
+        files, dirs = 0, 0
+        t = time.monotonic()
+        for d, ch in self._scn.walk(self._n, lambda: w.is_cancelled):
+            batch.append((d, ch))
+            for c in ch:
+                if c.isd:
+                    dirs += 1
+                else:
+                    files += 1
+            if time.monotonic() - t >= self._FLUSH:
+                self.app.call_from_thread(self._add, batch, files, dirs, False)
+                batch = []
+                t = time.monotonic()
+        if w.is_cancelled:
+            return
+        self.app.call_from_thread(self._add, batch, files, dirs, True)
+        # keep tree in step with the file system
+        for ch in DirWatcher(self._scn).watch(lambda: w.is_cancelled):
+            c = []
+            for path, new, gone, moved in ch:
+                nodes = [
+                    PathNode(_dir_label(f"{path}/{n}"), [], f"{path}/{n}", True)
+                    if d
+                    else PathNode(n, None, f"{path}/{n}")
+                    for n, d in new
+                ]
+                # read new directories here, off the event loop
+                below = [b for n in nodes if n.isd for b in self._scn.walk(n)]
+                c.append((path, nodes, gone, moved, below))
+            if w.is_cancelled:
+                return
+            self.app.call_from_thread(self._apply, c)
 
     def compose(self) -> ComposeResult:
         # 'NodeTree'
         with Center():
-            root = [Node("first", None), self._n]
-            n = NodeTree(root, "single", auto_select=True, limit=15)
-            yield n
+            yield self._nt
         # 'Divider'
         with Center() as c:
             c.styles.width = 3
@@ -53,6 +182,5 @@ class FileWindow(Horizontal):
             yield d
         # 'Message'
         with Center():
-            m = Message(self._MSG)
-            m.styles.margin = (0, 1, 0, 0)
-            yield m
+            self._msg.styles.margin = (0, 1, 0, 0)
+            yield self._msg
@@ -1,16 +1,282 @@
 """description for 'GameWindow'"""
 
+# stdlib
+import asyncio
+
+# rich
+from rich.text import Text
+
+# yaml
+import yaml
+
 # textual
-from textual.containers import Container
+from textual import work
+from textual._cache import LRUCache
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.strip import Strip
+from textual.widget import Widget
+from textual.widgets import Input
+
+# here
+from ..engine.cache import QuizCache
+from ..engine.index import QuizIndex
+from ..engine.progress import ProgressStore
+from ..engine.quiz import Question, Quiz, QuizError
+from ..engine.runner import QuizRunner
+from ..other import Message
 
 
 TITLE = "Game"
 
 
-class GameWindow(Container):
+class _QuestionView(Widget):
+    """question and its info tags, laid out once per width and kept as strips"""
+
+    COMPONENT_CLASSES = {
+        "_question-view--question",
+        "_question-view--info",
+    }
+
+    DEFAULT_CSS = """
+        _QuestionView {
+            height: auto;
+            margin-bottom: 1;
+            max-width: 80;
+            padding: 0 1;
+            width: 1fr;
+        }
+        _QuestionView > ._question-view--question {
+            color: $text;
+            text-style: bold;
+        }
+        _QuestionView > ._question-view--info {
+            color: $text-muted;
+            text-style: italic;
+        }
+    """
+
+    _CACHE_SIZE = 64  # laid out (question, width) pairs to keep
+
+    __slots__ = [
+        "_cac",  # layout cache, ('Question', width) -> strips
+        "_nxt",  # questions prepared, not yet shown, laid out again on resize
+        "que",  # shown 'Question', 'None' if none
+    ]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._cac = LRUCache(self._CACHE_SIZE)
+        self._nxt = []
+        self.que = None
+
+    def _layout(self, q: Question, w: int) -> list[Strip]:
+        """return strips of 'q' wrapped to width 'w'"""
+        c = self.app.console
+        t = Text(
+            q.que, self.get_component_rich_style("_question-view--question"), justify="center"
+        )
+        if q.inf:
+            t.append("\n\n")
+            t.append(" · ".join(q.inf), self.get_component_rich_style("_question-view--info"))
+        lines = c.render_lines(t, c.options.update_width(w), pad=False)
+        return [Strip(ln).extend_cell_length(w) for ln in lines]
+
+    def _prerender(self) -> None:
+        """lay out the prepared questions at current width, one per frame until all are"""
+        w = self.size.width
+        for q in self._nxt:
+            if w and (q, w) not in self._cac:
+                self.strips(q, w)
+                self.call_after_refresh(self._prerender)
+                return
+
+    def get_content_height(self, container, viewport, width: int) -> int:
+        return len(self.strips(self.que, width)) if self.que else 0
+
+    def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self._cac.clear()
+
+    def on_resize(self) -> None:
+        """on widget resize event"""
+        self.call_after_refresh(self._prerender)
+
+    def render_line(self, y: int) -> Strip:
+        w = self.size.width
+        s = self.strips(self.que, w) if self.que else []
+        return s[y] if y < len(s) else Strip.blank(w)
+
+    def prepare(self, q: Question) -> None:
+        """lay out 'q' at current width, ahead of showing it"""
+        self._nxt.append(q)
+        if self.size.width:
+            self.strips(q, self.size.width)
+
+    def show(self, q: Question | None) -> None:
+        """show question 'q', 'None' drops those prepared too"""
+        if q is None:
+            self._nxt.clear()
+        elif q in self._nxt:
+            self._nxt.remove(q)
+        self.que = q
+        self.refresh(layout=True)
+
+    def strips(self, q: Question, w: int) -> list[Strip]:
+        """return strips of 'q' at width 'w', laid out only if not cached"""
+        k = (q, w)
+        s = self._cac.get(k)
+        if s is None:
+            s = self._cac[k] = self._layout(q, w)
+        return s
+
+
+class GameWindow(Vertical):
     """the game window"""
 
     DEFAULT_CLASSES = "window"
 
-    def __init__(self) -> None:
+    DEFAULT_CSS = """
+        GameWindow {
+            align-vertical: middle;
+        }
+        GameWindow > Horizontal {
+            align-horizontal: center;
+            height: auto;
+        }
+        GameWindow Input {
+            margin-bottom: 1;
+            width: 40;
+        }
+    """
+
+    _AHEAD = 3  # questions prepared ahead, bound of the queue
+    _MSG_NONE = "Select the parts to quiz first"
+    _MSG_RIGHT = "Right!"
+    _MSG_WRONG = "Wrong, it was: {}"
+
+    __slots__ = [
+        "_cur",  # (section, 'Question') shown, 'None' if waiting on pipeline
+        "_inp",  # 'Input' ref.
+        "_msg",  # 'Message' ref.
+        "_prg",  # 'ProgressStore' answers go to, 'None' if none
+        "_qc",  # 'QuizCache' of compiled quiz files
+        "_que",  # 'asyncio.Queue' of prepared (section, 'Question')
+        "_qv",  # '_QuestionView' ref.
+        "_run",  # 'QuizRunner', 'None' if not started
+        "_sel",  # (path, section names) playing
+    ]
+
+    def __init__(self, progress: ProgressStore | None = None) -> None:
         super().__init__()
+        self._cur = None
+        self._inp = Input(placeholder="answer")
+        self._inp.display = False
+        self._msg = Message(self._MSG_NONE)
+        self._prg = progress
+        self._qc = QuizCache()
+        self._que = None
+        self._qv = _QuestionView()
+        self._run = None
+        self._sel = None
+
+    def _load(self, idx: QuizIndex, names: list[str]) -> Quiz:
+        """return sections 'names' of the indexed file, compiled if cached and fresh, else read from it"""
+        q = self._qc.get(idx.path, names)
+        return q if q is not None else idx.load(names)
+
+    def _next(self) -> None:
+        """show the next prepared question, if none yet the pipeline shows it once prepared"""
+        try:
+            self._cur = self._que.get_nowait()
+        except asyncio.QueueEmpty:
+            self._cur = None
+            return
+        self._qv.show(self._cur[1])
+
+    @work(exclusive=True)
+    async def _produce(self, idx: QuizIndex, names: list[str]) -> None:
+        """fill the queue with prepared questions of sections 'names', until cancelled
+
+        the quiz gets loaded off the event loop, then each drawn question
+        has its matcher built and gets laid out ahead; a full queue holds
+        this back until the player answers
+        """
+        try:
+            quiz = await asyncio.to_thread(self._load, idx, names)
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            self._sel = None  # to retry on next start
+            self._stop(f"Could not read quiz: {e.__class__.__name__}")
+            return
+        except QuizError as e:
+            self._sel = None
+            self._stop(f"Malformed quiz: {e}")
+            return
+        run = QuizRunner(quiz)
+        if self._prg is not None:  # weights left by earlier sessions
+            run.set_weights(await asyncio.to_thread(self._prg.weights, idx.path))
+        self._run = run
+        que = self._que = asyncio.Queue(self._AHEAD)
+        self._cur = None
+        self._qv.show(None)  # questions prepared for a previous session
+        self._inp.display = True
+        self._inp.value = ""
+        self._msg.update("")
+        self._inp.focus()
+        while True:
+            try:
+                s, q = run.ask()
+            except ValueError:  # nothing to draw
+                self._stop(self._MSG_NONE)
+                return
+            # answers normalized and question laid out here, not on submit
+            run.prepare(s, q.key)
+            self._qv.prepare(q)
+            await que.put((s, q))
+            if self._cur is None:  # if player waiting on it
+                self._next()
+
+    def _stop(self, msg: str) -> None:
+        """end the session, showing 'msg'"""
+        self._cur = self._que = self._run = None
+        self._qv.show(None)
+        self._inp.display = False
+        self._msg.update(msg)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """grade the answer, then go to next question"""
+        if self._cur is None:
+            return
+        s, q = self._cur
+        r = self._run.grade(event.value, s, q.key)
+        # drawn more often while missed, less once known
+        w = self._run.reweight(s, q.key, r["correct"])
+        if self._prg is not None:  # only queued, written off the event loop
+            self._prg.record(self._sel[0], s, q.key, r["correct"])
+            if w is not None:
+                self._prg.set_weight(self._sel[0], s, q.key, w)
+        self._msg.update(
+            self._MSG_RIGHT if r["correct"] else self._MSG_WRONG.format(" / ".join(q.ans))
+        )
+        self._inp.value = ""
+        self._next()
+
+    def start(self, idx: QuizIndex | None, names: list[str]) -> None:
+        """play sections 'names' of the indexed quiz file, unless already playing them
+
+        nothing selected ends the session
+        """
+        sel = (idx.path, tuple(names)) if idx is not None and names else None
+        if sel == self._sel:
+            return
+        self._sel = sel
+        if sel is None:
+            self.workers.cancel_node(self)
+            self._stop(self._MSG_NONE)
+            return
+        self._produce(idx, names)
+
+    def compose(self) -> ComposeResult:
+        for w in (self._qv, self._inp, self._msg):
+            with Horizontal():
+                yield w
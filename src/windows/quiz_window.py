@@ -1,29 +1,110 @@
 """description for 'QuizWindow'"""
 
+# stdlib
+import os
+
+# yaml
+import yaml
+
 # textual
-# from textual.app import ComposeResult
-from textual.containers import Container
+from textual import work
+from textual.app import ComposeResult
+from textual.containers import Horizontal
+from textual.worker import get_current_worker
 
 # here
-from ..node_tree import Node
+from ..engine.index import QuizIndex
+from ..node_tree import NodeTree, TreeProvider
+from ..other import Center, Divider, Message
 
 
 TITLE = "Quiz"
 
 
-class QuizWindow(Container):
+class _SectionProvider(TreeProvider):
+    """sections of a 'QuizIndex', read from it as is, the index as root"""
+
+    __slots__ = [
+        "_cnt",  # section name -> question count
+        "_idx",  # 'QuizIndex' ref.
+    ]
+
+    def __init__(self, idx: QuizIndex) -> None:
+        self._cnt = idx.counts()
+        self._idx = idx
+
+    def children(self, item) -> list[str] | None:
+        return list(self._cnt) if item is self._idx else None
+
+    def is_leaf(self, item) -> bool:
+        return item is not self._idx or not self._cnt
+
+    def label(self, item) -> str:
+        if item is self._idx:
+            return os.path.basename(item.path)
+        return f"{item} ({self._cnt[item]})"
+
+
+class QuizWindow(Horizontal):
     """the quiz window"""
 
     DEFAULT_CLASSES = "window"
 
     _MSG = "Select the part to quiz"
+    _MSG_NONE = "Select a file first"
 
-    _N: Node = None
+    __slots__ = [
+        "_box",  # 'Center' ref. holding the 'NodeTree'
+        "_idx",  # 'QuizIndex' of shown file
+        "_msg",  # 'Message' ref.
+    ]
 
     def __init__(self) -> None:
         super().__init__()
+        self._box = Center()
+        self._idx = None
+        self._msg = Message(self._MSG_NONE)
+
+    def _show(self, idx: QuizIndex | None, err: str | None = None) -> None:
+        self._idx = idx
+        self._box.remove_children()
+        if idx is None:
+            self._msg.update(err or self._MSG_NONE)
+            return
+        p = _SectionProvider(idx)
+        if not p.is_leaf(idx):
+            self._box.mount(NodeTree([idx], provider=p))
+        self._msg.update(self._MSG)
+
+    def get_selected(self) -> tuple[QuizIndex | None, list[str]]:
+        """return index of shown file and the selected section names"""
+        if not self._box.children:
+            return (self._idx, [])
+        return (self._idx, self._box.query_one(NodeTree).get_selected_nodes())
+
+    @work(thread=True, exclusive=True)
+    def show(self, path: str | None) -> None:
+        """index quiz file 'path' and show its sections"""
+        w = get_current_worker()
+        idx, err = None, None
+        if path is not None:
+            try:
+                idx = QuizIndex.build(path, lambda: w.is_cancelled)
+            except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+                err = f"Could not read quiz: {e.__class__.__name__}"
+        if not w.is_cancelled:
+            self.app.call_from_thread(self._show, idx, err)
 
-    # def compose(self) -> ComposeResult:
-    # 	pass
-    # 	with Container() as c3:
-    # 		c3.styles.align = ("center")
+    def compose(self) -> ComposeResult:
+        # 'NodeTree'
+        yield self._box
+        # 'Divider'
+        with Center() as c:
+            c.styles.width = 3
+            d = Divider()
+            d.styles.height = "70%"
+            yield d
+        # 'Message'
+        with Center():
+            self._msg.styles.margin = (0, 1, 0, 0)
+            yield self._msg